@@ -41,6 +41,76 @@ def bfs_agent(initial_state, goal_state):
 
     return None
 
+def get_predecessors(state):
+    # Every move only swaps the blank with a nearby stone, so it can be undone by the
+    # same swap: the states that lead to `state` are exactly its successors.
+    return get_successors(state)
+
+def path_length(parents, state):
+    """Number of moves between state and the root of the given parent map."""
+    length = 0
+    while parents[state] is not None:
+        state = parents[state]
+        length += 1
+    return length
+
+def expand_layer(frontier, parents, other_parents, expand):
+    """Expand one full BFS layer and collect the states where it touches the other search."""
+    next_frontier = []
+    meetings = []
+    for state in frontier:
+        for successor in expand(state):
+            if successor in parents:
+                continue
+            parents[successor] = state
+            next_frontier.append(successor)
+            if successor in other_parents:
+                meetings.append(successor)
+    return next_frontier, meetings
+
+def bidirectional_bfs_agent(initial_state, goal_state):
+    """Run BFS from both ends at once, always growing the smaller frontier.
+
+    Returns (path, forward_expanded, backward_expanded).
+    """
+    forward_parents = {initial_state: None}
+    backward_parents = {goal_state: None}
+    forward_frontier = [initial_state]
+    backward_frontier = [goal_state]
+    forward_expanded = 0
+    backward_expanded = 0
+    meetings = [initial_state] if initial_state == goal_state else []
+
+    while not meetings and forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_expanded += len(forward_frontier)
+            forward_frontier, meetings = expand_layer(forward_frontier, forward_parents,
+                                                      backward_parents, get_successors)
+        else:
+            backward_expanded += len(backward_frontier)
+            backward_frontier, meetings = expand_layer(backward_frontier, backward_parents,
+                                                       forward_parents, get_predecessors)
+
+    if not meetings:
+        return None, forward_expanded, backward_expanded
+
+    # Every meeting state in the last layer is equally deep on the side that was expanded,
+    # so the shortest path goes through the one closest to the root of the other side.
+    meeting = min(meetings, key=lambda state: path_length(forward_parents, state)
+                  + path_length(backward_parents, state))
+
+    path = []
+    state = meeting
+    while state is not None:
+        path.append(state)
+        state = forward_parents[state]
+    path.reverse()
+    state = backward_parents[meeting]
+    while state is not None:
+        path.append(state)
+        state = backward_parents[state]
+    return path, forward_expanded, backward_expanded
+
 # Example of using the BFS agent
 initial_state = ('E', 'E', 'E', '_', 'W', 'W', 'W')
 goal_state = ('W', 'W', 'W', '_', 'E', 'E', 'E')
@@ -49,3 +119,9 @@ solution_bfs = bfs_agent(initial_state, goal_state)
 print("BFS Solution:")
 for step in solution_bfs:
     print(step)
+
+solution_bidirectional, forward_expanded, backward_expanded = bidirectional_bfs_agent(initial_state, goal_state)
+print("Bidirectional BFS Solution:")
+for step in solution_bidirectional:
+    print(step)
+print(f"Nodes expanded: {forward_expanded} forward, {backward_expanded} backward")
@@ -1,4 +1,5 @@
-from collections import deque
+import argparse
+from collections import OrderedDict, deque
 
 def is_goal(state):
     return state == ['W', 'W', 'W', '_', 'E', 'E', 'E']
@@ -41,11 +42,91 @@ def dfs_agent(initial_state, goal_state):
 
     return None
 
-# Example of using the DFS agent
-initial_state = ('E', 'E', 'E', '_', 'W', 'W', 'W')
-goal_state = ('W', 'W', 'W', '_', 'E', 'E', 'E')
+def depth_limited_search(initial_state, goal_state, limit, cache=None, cache_size=0):
+    """Depth-first search that never goes deeper than limit.
 
-solution_dfs = dfs_agent(initial_state, goal_state)
-print("DFS Solution:")
-for step in solution_dfs:
-    print(step)
+    Only the current path is kept, so memory grows linearly with depth. The optional
+    cache maps states to the shallowest depth they were reached at in this iteration and
+    evicts the least recently used entry once it holds more than cache_size states.
+    Returns (path, cutoff, nodes_expanded); cutoff tells whether the limit was hit.
+    """
+    if initial_state == goal_state:
+        return [initial_state], False, 0
+    path = [initial_state]
+    on_path = {initial_state}
+    stack = [iter(get_successors(initial_state))]
+    cutoff = False
+    nodes_expanded = 1
+    if limit == 0:
+        return None, True, 0
+
+    while stack:
+        successor = next(stack[-1], None)
+        if successor is None:
+            stack.pop()
+            on_path.discard(path.pop())
+            continue
+        if successor in on_path:
+            continue
+
+        depth = len(path)
+        if successor == goal_state:
+            return path + [successor], cutoff, nodes_expanded
+        if depth >= limit:
+            cutoff = True
+            continue
+
+        if cache is not None:
+            # A state already reached at this depth or shallower had at least as much
+            # budget left then, so its subtree has been searched already.
+            seen_depth = cache.get(successor)
+            if seen_depth is not None and seen_depth <= depth:
+                cache.move_to_end(successor)
+                continue
+            cache[successor] = depth
+            cache.move_to_end(successor)
+            if len(cache) > cache_size:
+                cache.popitem(last=False)
+
+        path.append(successor)
+        on_path.add(successor)
+        stack.append(iter(get_successors(successor)))
+        nodes_expanded += 1
+
+    return None, cutoff, nodes_expanded
+
+def iddfs_agent(initial_state, goal_state, max_depth=None, cache_size=0):
+    """Iterative-deepening DFS: returns a shortest path using memory linear in its depth."""
+    depth_limit = 0
+    while max_depth is None or depth_limit <= max_depth:
+        cache = OrderedDict() if cache_size > 0 else None
+        path, cutoff, _ = depth_limited_search(initial_state, goal_state, depth_limit, cache, cache_size)
+        if path is not None:
+            return path
+        if not cutoff:
+            return None  # The whole reachable space fits under the limit
+        depth_limit += 1
+    return None
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rabbit leap puzzle solved with DFS or iterative-deepening DFS.")
+    parser.add_argument("--iddfs", action="store_true", help="use iterative deepening (shortest path, bounded memory)")
+    parser.add_argument("--max-depth", type=int, default=None, help="give up beyond this depth")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="memory ceiling for the transposition cache, in states (0 disables it)")
+    args = parser.parse_args()
+
+    initial_state = ('E', 'E', 'E', '_', 'W', 'W', 'W')
+    goal_state = ('W', 'W', 'W', '_', 'E', 'E', 'E')
+
+    if args.iddfs:
+        solution = iddfs_agent(initial_state, goal_state, args.max_depth, args.cache_size)
+        print("IDDFS Solution:")
+    else:
+        solution = dfs_agent(initial_state, goal_state)
+        print("DFS Solution:")
+    if solution is None:
+        print("No solution found")
+    else:
+        for step in solution:
+            print(step)
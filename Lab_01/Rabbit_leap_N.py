@@ -0,0 +1,195 @@
+import argparse
+from collections import deque
+
+# Every stone is packed into 2 bits of a single integer: '_' -> 0, 'E' -> 1, 'W' -> 2.
+# The index of the empty stone is kept above the stone bits so it never has to be searched for.
+STONE_CODES = {'_': 0, 'E': 1, 'W': 2}
+STONE_NAMES = {code: name for name, code in STONE_CODES.items()}
+
+# Define possible moves: left (-1), right (+1), jump left (-2), jump right (+2)
+MOVES = [-1, 1, -2, 2]
+
+def initial_state_for(n):
+    """Start position with n east-bound rabbits on the left and n west-bound rabbits on the right."""
+    return ('E',) * n + ('_',) + ('W',) * n
+
+def goal_state_for(n):
+    """Goal position: the two groups of n rabbits have swapped sides."""
+    return ('W',) * n + ('_',) + ('E',) * n
+
+def encode_state(state):
+    """Pack a tuple of stones into one integer (2 bits per stone, blank index on top)."""
+    code = 0
+    for index, stone in enumerate(state):
+        code |= STONE_CODES[stone] << (2 * index)
+    return code | (state.index('_') << (2 * len(state)))
+
+def decode_state(code, length):
+    """Unpack an integer produced by encode_state back into a tuple of stones."""
+    return tuple(STONE_NAMES[(code >> (2 * index)) & 3] for index in range(length))
+
+def get_successors(code, length):
+    """Generate the packed successor states of a packed state with the given number of stones."""
+    successors = []
+    shift = 2 * length
+    cells = code & ((1 << shift) - 1)
+    empty_index = code >> shift
+
+    for move in MOVES:
+        new_index = empty_index + move
+        if 0 <= new_index < length:
+            # Move the rabbit into the empty stone; the stone it leaves becomes the new blank
+            stone = (cells >> (2 * new_index)) & 3
+            new_cells = cells ^ (stone << (2 * new_index)) | (stone << (2 * empty_index))
+            successors.append(new_cells | (new_index << shift))
+
+    return successors
+
+def build_path(parents, code, length):
+    """Walk the parent map back from code to the start and return the decoded path."""
+    path = []
+    while code is not None:
+        path.append(decode_state(code, length))
+        code = parents[code]
+    return path[::-1]
+
+def bfs_agent(initial_state, goal_state, stats=None):
+    length = len(initial_state)
+    start = encode_state(initial_state)
+    goal = encode_state(goal_state)
+    queue = deque([start])
+    parents = {start: None}
+    expanded = 0
+
+    while queue:
+        code = queue.popleft()
+
+        if code == goal:
+            if stats is not None:
+                stats['expanded'] = expanded
+            return build_path(parents, code, length)
+        expanded += 1
+
+        for successor in get_successors(code, length):
+            if successor not in parents:
+                parents[successor] = code
+                queue.append(successor)
+
+    if stats is not None:
+        stats['expanded'] = expanded
+    return None
+
+def dfs_agent(initial_state, goal_state):
+    length = len(initial_state)
+    start = encode_state(initial_state)
+    goal = encode_state(goal_state)
+    # Each stack entry is just (state, state that pushed it) instead of a copy of the path
+    stack = [(start, None)]
+    parents = {}
+
+    while stack:
+        code, parent = stack.pop()
+
+        if code in parents:
+            continue
+        parents[code] = parent
+
+        if code == goal:
+            return build_path(parents, code, length)
+
+        for successor in get_successors(code, length):
+            if successor not in parents:
+                stack.append((successor, code))
+
+    return None
+
+def get_predecessors(code, length):
+    # Moves are swaps with the blank, so they are their own inverse
+    return get_successors(code, length)
+
+def path_length(parents, code):
+    """Number of moves between code and the root of the given parent map."""
+    length = 0
+    while parents[code] is not None:
+        code = parents[code]
+        length += 1
+    return length
+
+def expand_layer(frontier, parents, other_parents, expand, length):
+    """Expand one full BFS layer and collect the states where it touches the other search."""
+    next_frontier = []
+    meetings = []
+    for code in frontier:
+        for successor in expand(code, length):
+            if successor in parents:
+                continue
+            parents[successor] = code
+            next_frontier.append(successor)
+            if successor in other_parents:
+                meetings.append(successor)
+    return next_frontier, meetings
+
+def bidirectional_agent(initial_state, goal_state):
+    """Run BFS from both ends at once, always growing the smaller frontier.
+
+    Returns (path, forward_expanded, backward_expanded).
+    """
+    length = len(initial_state)
+    start = encode_state(initial_state)
+    goal = encode_state(goal_state)
+    forward_parents = {start: None}
+    backward_parents = {goal: None}
+    forward_frontier = [start]
+    backward_frontier = [goal]
+    forward_expanded = 0
+    backward_expanded = 0
+    meetings = [start] if start == goal else []
+
+    while not meetings and forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_expanded += len(forward_frontier)
+            forward_frontier, meetings = expand_layer(forward_frontier, forward_parents,
+                                                      backward_parents, get_successors, length)
+        else:
+            backward_expanded += len(backward_frontier)
+            backward_frontier, meetings = expand_layer(backward_frontier, backward_parents,
+                                                       forward_parents, get_predecessors, length)
+
+    if not meetings:
+        return None, forward_expanded, backward_expanded
+
+    meeting = min(meetings, key=lambda code: path_length(forward_parents, code)
+                  + path_length(backward_parents, code))
+    path = build_path(forward_parents, meeting, length)
+    code = backward_parents[meeting]
+    while code is not None:
+        path.append(decode_state(code, length))
+        code = backward_parents[code]
+    return path, forward_expanded, backward_expanded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rabbit leap puzzle with n rabbits on each side.")
+    parser.add_argument("n", type=int, nargs="?", default=3, help="number of rabbits per side")
+    parser.add_argument("--algorithm", choices=["bfs", "dfs", "bidirectional"], default="bfs")
+    args = parser.parse_args()
+
+    initial_state = initial_state_for(args.n)
+    goal_state = goal_state_for(args.n)
+
+    if args.algorithm == "bidirectional":
+        solution, forward_expanded, backward_expanded = bidirectional_agent(initial_state, goal_state)
+        print("Bidirectional BFS Solution:")
+    elif args.algorithm == "bfs":
+        stats = {}
+        solution = bfs_agent(initial_state, goal_state, stats)
+        print("BFS Solution:")
+    else:
+        solution = dfs_agent(initial_state, goal_state)
+        print("DFS Solution:")
+    for step in solution:
+        print(step)
+
+    if args.algorithm == "bidirectional":
+        print(f"Nodes expanded: {forward_expanded} forward, {backward_expanded} backward")
+    elif args.algorithm == "bfs":
+        print(f"Nodes expanded: {stats['expanded']}")
@@ -59,7 +59,11 @@ def print_solution(solution):
         solution = solution.parent
 
     # Print the solution from start to goal
-    for state in path[::-1]:
+    print_path(path[::-1])
+
+def print_path(path):
+    """Print a list of states ordered from start to goal."""
+    for state in path:
         m_left = state.m_left
         c_left = state.c_left
         m_right = state.m_right
@@ -99,9 +103,86 @@ def bfs(start_state):
     print("No solution found with BFS.")
     return False
 
+def get_predecessors(state):
+    """Generate all states that reach this state in one crossing."""
+    # Rowing the same people back undoes a crossing, and that reverse move is exactly
+    # what get_successors generates from the boat's current side.
+    return state.get_successors()
+
+def path_length(parents, state):
+    """Number of crossings between state and the root of the given parent map."""
+    length = 0
+    while parents[state] is not None:
+        state = parents[state]
+        length += 1
+    return length
+
+def expand_layer(frontier, parents, other_parents, expand):
+    """Expand one full BFS layer and collect the states where it touches the other search."""
+    next_frontier = []
+    meetings = []
+    for state in frontier:
+        for successor in expand(state):
+            if successor in parents:
+                continue
+            parents[successor] = state
+            next_frontier.append(successor)
+            if successor in other_parents:
+                meetings.append(successor)
+    return next_frontier, meetings
+
+def bidirectional_bfs(start_state, goal_state):
+    """Bidirectional Breadth-First Search, growing the smaller frontier each round."""
+    forward_parents = {start_state: None}
+    backward_parents = {goal_state: None}
+    forward_frontier = [start_state]
+    backward_frontier = [goal_state]
+    forward_expanded = 0
+    backward_expanded = 0
+    meetings = [start_state] if start_state == goal_state else []
+
+    while not meetings and forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_expanded += len(forward_frontier)
+            forward_frontier, meetings = expand_layer(forward_frontier, forward_parents,
+                                                      backward_parents, State.get_successors)
+        else:
+            backward_expanded += len(backward_frontier)
+            backward_frontier, meetings = expand_layer(backward_frontier, backward_parents,
+                                                       forward_parents, get_predecessors)
+
+    if not meetings:
+        print("No solution found with bidirectional BFS.")
+        print(f"Nodes expanded: {forward_expanded} forward, {backward_expanded} backward")
+        return False
+
+    meeting = min(meetings, key=lambda state: path_length(forward_parents, state)
+                  + path_length(backward_parents, state))
+    path = []
+    state = meeting
+    while state is not None:
+        path.append(state)
+        state = forward_parents[state]
+    path.reverse()
+    state = backward_parents[meeting]
+    while state is not None:
+        path.append(state)
+        state = backward_parents[state]
+
+    print("Solution found with bidirectional BFS!")
+    print_path(path)
+    print(f"Nodes expanded: {forward_expanded} forward, {backward_expanded} backward")
+    return True
+
 # Initial state: 3 missionaries and 3 cannibals on the left side, boat on the left
 start_state = State(3, 3, 1, 0, 0)
 
 # Solve using BFS
 print("BFS Solution:")
 bfs(start_state)
+
+# Goal state: everyone on the right side, boat on the right
+goal_state = State(0, 0, 0, 3, 3)
+
+print("Bidirectional BFS Solution:")
+bidirectional_bfs(start_state, goal_state)
@@ -0,0 +1,121 @@
+import argparse
+from array import array
+from collections import deque
+from functools import lru_cache
+
+# A state is packed into one small integer:
+#   code = (m_left * (cannibals + 1) + c_left) * 2 + boat
+# where boat is 1 when the boat is on the left side and 0 when it is on the right.
+
+def encode_state(m_left, c_left, boat, cannibals):
+    return (m_left * (cannibals + 1) + c_left) * 2 + boat
+
+def decode_state(code, cannibals):
+    """Return (m_left, c_left, boat) for a packed state."""
+    people, boat = divmod(code, 2)
+    m_left, c_left = divmod(people, cannibals + 1)
+    return m_left, c_left, boat
+
+def is_valid(m_left, c_left, missionaries, cannibals):
+    """Missionaries may never be outnumbered on a bank where any of them stand."""
+    m_right = missionaries - m_left
+    c_right = cannibals - c_left
+    return 0 <= m_left <= missionaries and 0 <= c_left <= cannibals \
+        and (m_left == 0 or m_left >= c_left) \
+        and (m_right == 0 or m_right >= c_right)
+
+@lru_cache(maxsize=None)
+def legal_moves(boat_capacity):
+    """All (M, C) boat loads with at least one and at most boat_capacity people, sorted by M."""
+    return tuple((m, c) for m in range(boat_capacity + 1)
+                 for c in range(boat_capacity + 1 - m) if m + c > 0)
+
+@lru_cache(maxsize=32)
+def build_transition_table(missionaries, cannibals, boat_capacity):
+    """Successor codes of every state of one configuration, computed once and cached.
+
+    Invalid states get an empty tuple so the table can be indexed by any code.
+    """
+    moves = legal_moves(boat_capacity)
+    table = []
+    for code in range(encode_state(missionaries, cannibals, 1, cannibals) + 1):
+        m_left, c_left, boat = decode_state(code, cannibals)
+        if not is_valid(m_left, c_left, missionaries, cannibals):
+            table.append(())
+            continue
+
+        # The boat can only carry people from the bank it is on
+        if boat == 1:
+            available_m, available_c, direction = m_left, c_left, -1
+        else:
+            available_m, available_c, direction = missionaries - m_left, cannibals - c_left, 1
+
+        successors = []
+        for m, c in moves:
+            if m > available_m:
+                break
+            if c > available_c:
+                continue
+            new_m_left = m_left + direction * m
+            new_c_left = c_left + direction * c
+            if is_valid(new_m_left, new_c_left, missionaries, cannibals):
+                successors.append(encode_state(new_m_left, new_c_left, 1 - boat, cannibals))
+        table.append(tuple(successors))
+    return tuple(table)
+
+def solve(missionaries, cannibals, boat_capacity):
+    """Breadth-First Search over packed states.
+
+    Returns (path, number_of_visited_states) where path is a list of
+    (m_left, c_left, boat) tuples from start to goal, or None if unsolvable.
+    """
+    table = build_transition_table(missionaries, cannibals, boat_capacity)
+    start = encode_state(missionaries, cannibals, 1, cannibals)
+    parents = array('l', [-1]) * len(table)
+    parents[start] = start
+    queue = deque([start])
+    number_of_visited_states = 0
+
+    while queue:
+        code = queue.popleft()
+        number_of_visited_states += 1
+
+        # Everyone on the right bank, wherever the boat is (as in State.is_goal), so an
+        # instance without people is solved before any crossing
+        if code // 2 == 0:
+            path = [decode_state(code, cannibals)]
+            while code != start:
+                code = parents[code]
+                path.append(decode_state(code, cannibals))
+            return path[::-1], number_of_visited_states
+
+        for successor in table[code]:
+            if parents[successor] == -1:
+                parents[successor] = code
+                queue.append(successor)
+
+    return None, number_of_visited_states
+
+def print_solution(path, missionaries, cannibals):
+    """Print the solution path from start to goal."""
+    for m_left, c_left, boat in path:
+        print(f"Left -> Missionaries: {m_left}, Cannibals: {c_left}")
+        print(f"Right -> Missionaries: {missionaries - m_left}, Cannibals: {cannibals - c_left}")
+        print(f"Boat: {'left' if boat == 1 else 'right'}")
+        print("-" * 50)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Missionaries and cannibals for any instance size.")
+    parser.add_argument("missionaries", type=int, nargs="?", default=3)
+    parser.add_argument("cannibals", type=int, nargs="?", default=3)
+    parser.add_argument("boat_capacity", type=int, nargs="?", default=2)
+    args = parser.parse_args()
+
+    path, number_of_visited_states = solve(args.missionaries, args.cannibals, args.boat_capacity)
+    if path is None:
+        print("No solution found with BFS.")
+    else:
+        print("Solution found with BFS!")
+        print_solution(path, args.missionaries, args.cannibals)
+        print(f"Number of crossings: {len(path) - 1}")
+    print(f"Number of visited states: {number_of_visited_states}")
@@ -1,4 +1,5 @@
-from collections import deque
+import argparse
+from collections import OrderedDict, deque
 
 class State:
     def __init__(self, m_left, c_left, boat, m_right, c_right, parent=None):
@@ -99,9 +100,92 @@ def dfs(start_state):
     print("No solution found with DFS.")
     return False
 
-# Initial state: 3 missionaries and 3 cannibals on the left side, boat on the left
-start_state = State(3, 3, 1, 0, 0)
+def depth_limited_search(start_state, limit, cache=None, cache_size=0):
+    """Depth-Limited Search used by each IDDFS iteration.
 
-# Solve using DFS
-print("DFS Solution:")
-dfs(start_state)
+    Keeps only the states on the current path, plus at most cache_size entries of
+    state -> shallowest depth seen (least recently used entries are dropped first).
+    Returns (path, cutoff, nodes_expanded).
+    """
+    if start_state.is_goal():
+        return [start_state], False, 0
+    path = [start_state]
+    on_path = {start_state}
+    stack = [iter(start_state.get_successors())]
+    cutoff = False
+    nodes_expanded = 1
+    if limit == 0:
+        return None, True, 0
+
+    while stack:
+        successor = next(stack[-1], None)
+        if successor is None:
+            stack.pop()
+            on_path.discard(path.pop())
+            continue
+        if successor in on_path:
+            continue
+
+        depth = len(path)
+        if successor.is_goal():
+            return path + [successor], cutoff, nodes_expanded
+        if depth >= limit:
+            cutoff = True
+            continue
+
+        if cache is not None:
+            # Reached before with at least as much depth left: nothing new below it
+            seen_depth = cache.get(successor)
+            if seen_depth is not None and seen_depth <= depth:
+                cache.move_to_end(successor)
+                continue
+            cache[successor] = depth
+            cache.move_to_end(successor)
+            if len(cache) > cache_size:
+                cache.popitem(last=False)
+
+        path.append(successor)
+        on_path.add(successor)
+        stack.append(iter(successor.get_successors()))
+        nodes_expanded += 1
+
+    return None, cutoff, nodes_expanded
+
+def iddfs(start_state, max_depth=None, cache_size=0):
+    """Iterative-Deepening Depth-First Search algorithm."""
+    number_of_visited_states = 0
+    depth_limit = 0
+    while max_depth is None or depth_limit <= max_depth:
+        cache = OrderedDict() if cache_size > 0 else None
+        path, cutoff, nodes_expanded = depth_limited_search(start_state, depth_limit, cache, cache_size)
+        number_of_visited_states += nodes_expanded
+        if path is not None:
+            print("Solution found with IDDFS!")
+            print_solution(path[-1])
+            print(f"Number of visited states: {number_of_visited_states}")
+            return True
+        if not cutoff:
+            break  # The whole reachable space fits under the limit
+        depth_limit += 1
+
+    print("No solution found with IDDFS.")
+    return False
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Missionaries and cannibals solved with DFS or iterative-deepening DFS.")
+    parser.add_argument("--iddfs", action="store_true", help="use iterative deepening (shortest path, bounded memory)")
+    parser.add_argument("--max-depth", type=int, default=None, help="give up beyond this depth")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="memory ceiling for the transposition cache, in states (0 disables it)")
+    args = parser.parse_args()
+
+    # Initial state: 3 missionaries and 3 cannibals on the left side, boat on the left
+    start_state = State(3, 3, 1, 0, 0)
+
+    if args.iddfs:
+        print("IDDFS Solution:")
+        iddfs(start_state, args.max_depth, args.cache_size)
+    else:
+        # Solve using DFS
+        print("DFS Solution:")
+        dfs(start_state)
@@ -0,0 +1,86 @@
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from multiprocessing import Pool
+
+from missionary_cannibal_N import solve
+
+FIELDS = ["missionaries", "cannibals", "boat_capacity", "solvable",
+          "path_length", "states_visited", "wall_time"]
+
+def parse_range(text):
+    """Parse '5', '1,2,8' or '1-10' (inclusive) into a list of integers."""
+    values = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-")
+            values.extend(range(int(low), int(high) + 1))
+        else:
+            values.append(int(part))
+    return values
+
+def run_instance(instance):
+    """Solve one (missionaries, cannibals, boat_capacity) instance inside a worker process.
+
+    solve() caches transition tables per configuration, so a worker that sees
+    the same configuration again reuses the table it already built.
+    """
+    missionaries, cannibals, boat_capacity = instance
+    start_time = time.perf_counter()
+    path, states_visited = solve(missionaries, cannibals, boat_capacity)
+    wall_time = time.perf_counter() - start_time
+    return {
+        "missionaries": missionaries,
+        "cannibals": cannibals,
+        "boat_capacity": boat_capacity,
+        "solvable": path is not None,
+        "path_length": len(path) - 1 if path is not None else None,
+        "states_visited": states_visited,
+        "wall_time": wall_time,
+    }
+
+def sweep(instances, output, fmt, workers=None, chunksize=1):
+    """Solve every instance on a process pool and write each result as soon as it arrives."""
+    if fmt == "csv":
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(result):
+            output.write(json.dumps(result) + "\n")
+
+    count = 0
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(run_instance, instances, chunksize):
+            write(result)
+            output.flush()
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep missionaries-and-cannibals instances on a process pool.")
+    parser.add_argument("--missionaries", default="1-10", help="e.g. 3, 1,2,5 or 1-10")
+    parser.add_argument("--cannibals", default="1-10")
+    parser.add_argument("--boat-capacity", default="2-4")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=1)
+    parser.add_argument("--output", default="-", help="output file ending in .csv or .jsonl, '-' for stdout")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None,
+                        help="output format (default: taken from the file extension, jsonl for stdout)")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    instances = list(itertools.product(parse_range(args.missionaries),
+                                       parse_range(args.cannibals),
+                                       parse_range(args.boat_capacity)))
+
+    start_time = time.perf_counter()
+    if args.output == "-":
+        count = sweep(instances, sys.stdout, fmt, args.workers, args.chunksize)
+    else:
+        with open(args.output, "w", newline="") as output:
+            count = sweep(instances, output, fmt, args.workers, args.chunksize)
+    print(f"Solved {count} instances in {time.perf_counter() - start_time:.2f} seconds", file=sys.stderr)
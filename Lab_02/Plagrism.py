@@ -1,32 +1,122 @@
-import spacy
+import argparse
+import hashlib
+import json
+import os
 import numpy as np
 import heapq
 import re
+from collections import OrderedDict
 from Levenshtein import distance as levenshtein_distance
+from rapidfuzz.distance import Levenshtein
+from rapidfuzz.process import cdist
 
-# Load spaCy model
-nlp = spacy.load('en_core_web_sm')
+MODEL_NAME = 'en_core_web_sm'
+# Sentence pairs less similar than this count as unrelated (see calculate_similarity)
+SIMILARITY_CUTOFF = 0.5
+# Named entities are never used, so NER is not loaded. The dependency parser stays:
+# punctuation is stripped before spaCy runs, so it is what finds the sentence
+# boundaries, and swapping it for another component could change the split.
+EXCLUDED_COMPONENTS = ['ner']
 
-def preprocess_text(text):
-    """Preprocess the text: tokenize into sentences, normalize, and remove stopwords."""
-    # Normalize text: lowercase and remove punctuation
+_nlp = None
+
+def get_nlp():
+    """Load the spaCy pipeline on first use."""
+    global _nlp
+    if _nlp is None:
+        # Imported here so that runs served entirely from the sentence cache never pay for it
+        import spacy
+        _nlp = spacy.load(MODEL_NAME, exclude=EXCLUDED_COMPONENTS)
+    return _nlp
+
+class SentenceCache:
+    """LRU cache of preprocessed sentence lists keyed by a hash of the raw text.
+
+    With a directory, entries are also stored there as JSON files so they survive
+    between runs.
+    """
+
+    def __init__(self, max_entries=1024, directory=None):
+        self.max_entries = max_entries
+        self.directory = directory
+        self.entries = OrderedDict()
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(text):
+        # The pipeline is part of the key: another one may split or lemmatize differently
+        pipeline = ','.join(EXCLUDED_COMPONENTS)
+        return hashlib.sha256(f"{MODEL_NAME}\0{pipeline}\0{text}".encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        if self.directory is not None and os.path.exists(self._path(key)):
+            with open(self._path(key), encoding='utf-8') as f:
+                sentences = json.load(f)
+            self._remember(key, sentences)
+            return sentences
+        return None
+
+    def put(self, key, sentences):
+        self._remember(key, sentences)
+        if self.directory is not None:
+            with open(self._path(key), 'w', encoding='utf-8') as f:
+                json.dump(sentences, f)
+
+    def _remember(self, key, sentences):
+        self.entries[key] = sentences
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+sentence_cache = SentenceCache()
+
+def normalize_text(text):
+    """Normalize text: lowercase and remove punctuation."""
     text = text.lower()
-    text = re.sub(r'[^\w\s]', '', text)
-    
-    # Tokenize into sentences
-    doc = nlp(text)
-    sentences = [sent.text for sent in doc.sents]
-    
+    return re.sub(r'[^\w\s]', '', text)
+
+def sentences_from_doc(doc, stop_words):
+    """Lemmatize, remove stopwords, and keep only alphabetic words, sentence by sentence."""
     processed_sentences = []
-    for sentence in sentences:
-        doc = nlp(sentence)
-        # Lemmatize, remove stopwords, and keep only alphabetic words
-        words = [token.lemma_.lower() for token in doc if token.is_alpha]
-        words = [word for word in words if not nlp.vocab[word].is_stop]
+    for sent in doc.sents:
+        words = [token.lemma_.lower() for token in sent if token.is_alpha]
+        words = [word for word in words if word not in stop_words]
         processed_sentences.append(' '.join(words))
-    
     return processed_sentences
 
+def preprocess_texts(texts, batch_size=64, n_process=1, cache=None):
+    """Preprocess many texts with one batched nlp.pipe pass over the ones not cached yet."""
+    cache = sentence_cache if cache is None else cache
+    keys = [cache.key(text) for text in texts]
+    results = [cache.get(key) for key in keys]
+
+    missing = {}
+    for index, (key, result) in enumerate(zip(keys, results)):
+        if result is None:
+            missing.setdefault(key, []).append(index)
+    if missing:
+        nlp = get_nlp()
+        stop_words = nlp.Defaults.stop_words
+        pending = [normalize_text(texts[indices[0]]) for indices in missing.values()]
+        docs = nlp.pipe(pending, batch_size=batch_size, n_process=n_process)
+        for (key, indices), doc in zip(missing.items(), docs):
+            sentences = sentences_from_doc(doc, stop_words)
+            cache.put(key, sentences)
+            for index in indices:
+                results[index] = sentences
+    return [list(sentences) for sentences in results]
+
+def preprocess_text(text):
+    """Preprocess the text: tokenize into sentences, normalize, and remove stopwords."""
+    return preprocess_texts([text])[0]
+
 def compute_all_distances(sentences1, sentences2):
     """Compute Levenshtein distances between all pairs of sentences from two lists."""
     distances = []
@@ -79,6 +169,81 @@ def a_star_search(sentences1, sentences2):
     
     return alignments
 
+def sentence_distance_matrix(sentences1, sentences2, cutoff=None):
+    """Levenshtein distance of every sentence pair, each computed once.
+
+    Distances above cutoff come back as cutoff + 1, which lets each computation stop
+    as soon as the pair is known to exceed it.
+    """
+    return cdist(sentences1, sentences2, scorer=Levenshtein.distance, score_cutoff=cutoff,
+                 dtype=np.int32, workers=-1)
+
+def align_sentences(sentences1, sentences2):
+    """Align sentences with dynamic programming over a precomputed distance matrix.
+
+    Uses the same grid, moves and step costs (exact Levenshtein distances) as
+    a_star_search and returns a cheapest alignment. The result can still differ
+    from a_star_search's, and with it the plagiarism level: where several
+    alignments cost the same the two may pick different ones, and a_star_search's
+    heuristic can overestimate, so it occasionally settles for a costlier one.
+
+    The all-diagonal alignment gives an upper bound on the cheapest cost. A pair
+    farther apart than that bound is never paid for on a cheapest alignment, so
+    distances (and partial totals) are capped just above it without changing the
+    result. The table is filled one anti-diagonal at a time, keeping only the
+    totals of the two diagonals before it.
+    Returns (sent1, sent2, similarity) for each aligned pair.
+    """
+    len1, len2 = len(sentences1), len(sentences2)
+    if len1 == 0 or len2 == 0:
+        return []
+    bound = sum(levenshtein_distance(sentences1[t], sentences2[t]) for t in range(min(len1, len2) - 1))
+    costs = sentence_distance_matrix(sentences1, sentences2, cutoff=bound)
+    capped = bound + 1  # Also stands for "unreachable"
+
+    # came_from[i, j]: 1 = from (i-1, j), 2 = from (i, j-1), 3 = from (i-1, j-1)
+    came_from = np.zeros((len1 + 1, len2 + 1), dtype=np.uint8)
+    moves = np.array([3, 1, 2], dtype=np.uint8)
+    # Totals of the previous two anti-diagonals, indexed by row
+    before_last = np.full(len1 + 1, capped, dtype=np.int64)
+    last = np.full(len1 + 1, capped, dtype=np.int64)
+    last[0] = 0
+
+    for diagonal in range(1, len1 + len2 + 1):
+        rows = np.arange(max(0, diagonal - len2), min(len1, diagonal) + 1)
+        cols = diagonal - rows
+        up_rows = np.maximum(rows - 1, 0)
+        left_cols = np.maximum(cols - 1, 0)
+        # A step costs the distance of the pair it leaves, unless it enters a cell past
+        # the last sentence of either document
+        inside = (rows < len1) & (cols < len2)
+        from_up = np.where(inside & (rows > 0), costs[up_rows, np.minimum(cols, len2 - 1)], 0)
+        from_left = np.where(inside & (cols > 0), costs[np.minimum(rows, len1 - 1), left_cols], 0)
+        from_diagonal = np.where(inside & (rows > 0) & (cols > 0), costs[up_rows, left_cols], 0)
+        candidates = np.stack([
+            np.where((rows > 0) & (cols > 0), before_last[up_rows] + from_diagonal, capped),
+            np.where(rows > 0, last[up_rows] + from_up, capped),
+            np.where(cols > 0, last[rows] + from_left, capped),
+        ])
+        best = np.argmin(candidates, axis=0)  # Ties prefer the diagonal, then up
+        current = np.full(len1 + 1, capped, dtype=np.int64)
+        current[rows] = np.minimum(candidates[best, np.arange(len(rows))], capped)
+        came_from[rows, cols] = moves[best]
+        before_last, last = last, current
+
+    alignments = []
+    i, j = len1, len2
+    while i > 0 or j > 0:
+        move = came_from[i, j]
+        if move & 1:
+            i -= 1
+        if move & 2:
+            j -= 1
+        if i < len1 and j < len2:
+            alignments.append((sentences1[i], sentences2[j], calculate_similarity(sentences1[i], sentences2[j])))
+    alignments.reverse()
+    return alignments
+
 def calculate_similarity(s1, s2):
     """Calculate the similarity between two sentences based on Levenshtein distance."""
     dist = levenshtein_distance(s1, s2)
@@ -99,14 +264,7 @@ def calculate_similarity(s1, s2):
 
 def detect_plagiarism(sentences1, sentences2):
     """Detect potential plagiarism and return all similar sentence pairs."""
-    alignments = a_star_search(sentences1, sentences2)
-    plagiarized_pairs = []
-    
-    for sent1, sent2 in alignments:
-        similarity = calculate_similarity(sent1, sent2)
-        plagiarized_pairs.append((sent1, sent2, similarity))
-    
-    return plagiarized_pairs
+    return align_sentences(sentences1, sentences2)
 
 def calculate_plagiarism_level(plagiarized_pairs):
     """Calculate the overall level of plagiarism."""
@@ -117,17 +275,23 @@ def calculate_plagiarism_level(plagiarized_pairs):
     num_pairs = len(plagiarized_pairs)
     return total_similarity / num_pairs  # Average similarity score
 
-# Example usage
-text1 = input("Enter the first text: ")
-text2 = input("Enter the second text: ")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Detect plagiarism between two texts.")
+    parser.add_argument("--cache-dir", default=None, help="keep preprocessed sentences on disk between runs")
+    args = parser.parse_args()
+    if args.cache_dir is not None:
+        sentence_cache = SentenceCache(directory=args.cache_dir)
+
+    # Example usage
+    text1 = input("Enter the first text: ")
+    text2 = input("Enter the second text: ")
 
-# Preprocess and tokenize the documents
-processed_sent1 = preprocess_text(text1)
-processed_sent2 = preprocess_text(text2)
+    # Preprocess and tokenize the documents in one batch
+    processed_sent1, processed_sent2 = preprocess_texts([text1, text2])
 
-# Detect plagiarism based on similarity
-plagiarized_pairs = detect_plagiarism(processed_sent1, processed_sent2)
+    # Detect plagiarism based on similarity
+    plagiarized_pairs = detect_plagiarism(processed_sent1, processed_sent2)
 
-# Calculate the overall level of plagiarism
-plagiarism_level = calculate_plagiarism_level(plagiarized_pairs)
-print(f"Overall level of plagiarism: {plagiarism_level * 100:.2f}%")
+    # Calculate the overall level of plagiarism
+    plagiarism_level = calculate_plagiarism_level(plagiarized_pairs)
+    print(f"Overall level of plagiarism: {plagiarism_level * 100:.2f}%")
@@ -40,8 +40,11 @@ def is_solvable(state):
                 inversions += 1
     return inversions % 2 == 0
 
-def dfs(start_state, goal_state):
-    """Perform Depth-First Search (DFS) to find the shortest solution path."""
+def dfs_search(start_state, goal_state):
+    """Run Depth-First Search (DFS) to find the shortest solution path.
+
+    Returns (path, nodes_explored); path is None when no solution exists.
+    """
     start_node = Node(start_state)
     stack = [start_node]
     visited = set()
@@ -60,15 +63,22 @@ def dfs(start_state, goal_state):
             while node:
                 path.append(node.state)
                 node = node.parent
-            print(f"Solution found! Total nodes explored: {nodes_explored}")
-            return path[::-1]
+            return path[::-1], nodes_explored
 
         for successor in get_successors(node):
             if tuple(successor.state) not in visited:
                 stack.append(successor)
 
-    print(f"No solution found. Total nodes explored: {nodes_explored}")
-    return None
+    return None, nodes_explored
+
+def dfs(start_state, goal_state):
+    """Perform Depth-First Search (DFS) to find the shortest solution path."""
+    path, nodes_explored = dfs_search(start_state, goal_state)
+    if path is not None:
+        print(f"Solution found! Total nodes explored: {nodes_explored}")
+    else:
+        print(f"No solution found. Total nodes explored: {nodes_explored}")
+    return path
 
 def print_solution(solution):
     """Print the solution steps in a readable format."""
@@ -108,5 +118,6 @@ if __name__ == "__main__":
             print_solution(solution)
         else:
             print("No solution found.")
+        print(f"Time taken: {end_time - start_time:.4f} seconds, peak memory: {memory_peak:.2f} KB")
     else:
         print("The given start state is not solvable.")
@@ -0,0 +1,137 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import numpy as np
+
+from Plagrism import SentenceCache, calculate_plagiarism_level, detect_plagiarism, preprocess_texts
+from plagiarism_corpus import MinHasher, band_keys, estimated_jaccard
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    signature BLOB NOT NULL,
+    sentences TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    band INTEGER NOT NULL,
+    key BLOB NOT NULL,
+    doc_id INTEGER NOT NULL,
+    PRIMARY KEY (band, key, doc_id)
+) WITHOUT ROWID;
+"""
+MMAP_SIZE = 1 << 30  # Let SQLite map up to 1 GiB of the file instead of copying pages
+
+
+class FingerprintStore:
+    """Durable MinHash/LSH fingerprints of a reference corpus, stored in one SQLite file.
+
+    Documents are appended in place, and lookups go through the bucket index on disk,
+    so opening the store does not load the corpus into Python objects.
+    """
+
+    def __init__(self, path, num_perm=128, bands=64, seed=1):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        self.connection.execute("PRAGMA journal_mode = WAL")  # Readers keep working during appends
+        self.connection.executescript(SCHEMA)
+
+        # A store keeps the hashing parameters it was created with
+        settings = dict(self.connection.execute("SELECT key, value FROM meta"))
+        if not settings:
+            settings = {"num_perm": str(num_perm), "bands": str(bands), "seed": str(seed)}
+            with self.connection:
+                self.connection.executemany("INSERT INTO meta VALUES (?, ?)", settings.items())
+        self.bands = int(settings["bands"])
+        self.hasher = MinHasher(int(settings["num_perm"]), int(settings["seed"]))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def add_many(self, documents):
+        """Append (name, sentences) pairs in one transaction; names already stored are skipped."""
+        added = 0
+        with self.connection:
+            for name, sentences in documents:
+                signature = self.hasher.signature(sentences)
+                cursor = self.connection.execute(
+                    "INSERT OR IGNORE INTO documents (name, signature, sentences) VALUES (?, ?, ?)",
+                    (name, signature.tobytes(), json.dumps(sentences)))
+                if cursor.rowcount == 0:
+                    continue
+                self.connection.executemany(
+                    "INSERT INTO buckets VALUES (?, ?, ?)",
+                    ((band, key, cursor.lastrowid) for band, key in enumerate(band_keys(signature, self.bands))))
+                added += 1
+        return added
+
+    def add(self, name, sentences):
+        return self.add_many([(name, sentences)])
+
+    def query(self, sentences, top_k=5):
+        """Return (candidates, number_of_candidates); candidates are the top_k
+        (doc_id, name, estimated_jaccard) triples among documents sharing a bucket."""
+        signature = self.hasher.signature(sentences)
+        candidate_ids = set()
+        for band, key in enumerate(band_keys(signature, self.bands)):
+            candidate_ids.update(doc_id for (doc_id,) in self.connection.execute(
+                "SELECT doc_id FROM buckets WHERE band = ? AND key = ?", (band, key)))
+        if not candidate_ids:
+            return [], 0
+
+        placeholders = ",".join("?" * len(candidate_ids))
+        rows = self.connection.execute(
+            f"SELECT id, name, signature FROM documents WHERE id IN ({placeholders})", tuple(candidate_ids))
+        scored = [(doc_id, name, estimated_jaccard(signature, np.frombuffer(stored, dtype=np.uint64)))
+                  for doc_id, name, stored in rows]
+        scored.sort(key=lambda item: item[2], reverse=True)
+        return scored[:top_k], len(candidate_ids)
+
+    def sentences(self, doc_id):
+        row = self.connection.execute("SELECT sentences FROM documents WHERE id = ?", (doc_id,)).fetchone()
+        return json.loads(row[0])
+
+    def close(self):
+        self.connection.close()
+
+def read_texts(paths):
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            yield os.path.basename(path), f.read()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Persistent fingerprint store for the plagiarism corpus.")
+    parser.add_argument("--cache-dir", default=None, help="keep preprocessed sentences on disk between runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add_parser = commands.add_parser("add", help="append documents to the store")
+    add_parser.add_argument("store")
+    add_parser.add_argument("files", nargs="+")
+    check_parser = commands.add_parser("check", help="check a document against the store")
+    check_parser.add_argument("store")
+    check_parser.add_argument("submission")
+    check_parser.add_argument("--top-k", type=int, default=5, help="candidates sent to full alignment")
+    args = parser.parse_args()
+
+    cache = SentenceCache(directory=args.cache_dir) if args.cache_dir else None
+    store = FingerprintStore(args.store)
+    if args.command == "add":
+        names, texts = zip(*read_texts(args.files))
+        added = store.add_many(zip(names, preprocess_texts(list(texts), cache=cache)))
+        print(f"Added {added} documents, store now holds {len(store)}")
+    else:
+        [(_, text)] = read_texts([args.submission])
+        [submission] = preprocess_texts([text], cache=cache)
+        start_time = time.perf_counter()
+        candidates, number_of_candidates = store.query(submission, args.top_k)
+        query_time = time.perf_counter() - start_time
+        for doc_id, name, jaccard in candidates:
+            plagiarism_level = calculate_plagiarism_level(detect_plagiarism(submission, store.sentences(doc_id)))
+            print(f"{name}: plagiarism {plagiarism_level * 100:.2f}% (estimated shingle overlap {jaccard:.2f})")
+        print(f"Candidates: {number_of_candidates} of {len(store)} documents, "
+              f"query latency {query_time * 1000:.2f} ms", file=sys.stderr)
+    store.close()
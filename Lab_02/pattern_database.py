@@ -0,0 +1,185 @@
+import argparse
+import mmap
+import os
+import time
+from math import perm
+
+# File layout: MAGIC, board size, number of pattern tiles, the tiles, then one byte per
+# placement of the pattern tiles (indexed by rank_placement) holding the number of
+# pattern-tile moves needed to bring them home.
+MAGIC = b"PDB1"
+UNKNOWN = 255
+
+PARTITIONS = {
+    3: {
+        "4-4": ((1, 2, 3, 4), (5, 6, 7, 8)),
+    },
+    4: {
+        "7-8": ((1, 2, 3, 4, 5, 6, 7), (8, 9, 10, 11, 12, 13, 14, 15)),
+        "6-6-3": ((1, 2, 3, 4, 5, 6), (7, 8, 9, 10, 11, 12), (13, 14, 15)),
+        "5-5-5": ((1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11, 12, 13, 14, 15)),
+    },
+}
+# What the builder writes and the solvers load when no partition is given
+DEFAULT_PARTITION = {3: "4-4", 4: "5-5-5"}
+
+def rank_placement(positions, cells):
+    """Rank of a sequence of distinct positions among all k-permutations of cells positions."""
+    k = len(positions)
+    rank = 0
+    for i, position in enumerate(positions):
+        smaller = position
+        for earlier in positions[:i]:
+            if earlier < position:
+                smaller -= 1
+        rank += smaller * perm(cells - 1 - i, k - 1 - i)
+    return rank
+
+def build_pattern_database(size, tiles):
+    """Retrograde BFS from the goal over placements of the pattern tiles and the blank.
+
+    Only moves of pattern tiles cost anything, which keeps databases for disjoint
+    tile sets additive. Returns a bytearray indexed by rank_placement.
+    """
+    cells = size * size
+    count = perm(cells, len(tiles))
+    table = bytearray([UNKNOWN]) * count
+    seen = bytearray((count * cells + 7) // 8)
+    neighbors = []
+    for blank in range(cells):
+        row, col = divmod(blank, size)
+        neighbors.append([blank + delta for delta, ok in
+                          ((-size, row > 0), (size, row < size - 1), (-1, col > 0), (1, col < size - 1)) if ok])
+
+    def visit(positions, blank):
+        rank = rank_placement(positions, cells)
+        bit = rank * cells + blank
+        if seen[bit >> 3] & (1 << (bit & 7)):
+            return False
+        seen[bit >> 3] |= 1 << (bit & 7)
+        if table[rank] == UNKNOWN:
+            table[rank] = cost
+        return True
+
+    cost = 0
+    goal = tuple(tile - 1 for tile in tiles)
+    frontier = [(goal, cells - 1)]
+    visit(goal, cells - 1)
+    while frontier:
+        next_frontier = []
+        # The blank wanders over non-pattern cells for free, so close the level first
+        stack = frontier
+        while stack:
+            positions, blank = stack.pop()
+            for target in neighbors[blank]:
+                if target in positions:
+                    index = positions.index(target)
+                    moved = positions[:index] + (blank,) + positions[index + 1:]
+                    next_frontier.append((moved, target))
+                elif visit(positions, target):
+                    stack.append((positions, target))
+        cost += 1
+        frontier = [(positions, blank) for positions, blank in next_frontier if visit(positions, blank)]
+    return table
+
+def write_pattern_database(path, size, tiles, table):
+    with open(path, "wb") as f:
+        f.write(MAGIC + bytes([size, len(tiles)]) + bytes(tiles))
+        f.write(table)
+
+def database_filename(size, tiles):
+    return f"pdb{size}_{'-'.join(map(str, tiles))}.pdb"
+
+
+class PatternDatabase:
+    """A pattern database file mapped read-only into memory.
+
+    Every process that opens the same file shares one copy through the page cache.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.data) < 6 or self.data[:4] != MAGIC:
+            raise ValueError(f"{path} is not a pattern database")
+        self.size = self.data[4]
+        self.tiles = tuple(self.data[6:6 + self.data[5]])
+        self.offset = 6 + len(self.tiles)
+        self.cells = self.size * self.size
+        expected = self.offset + perm(self.cells, len(self.tiles))
+        if len(self.tiles) != self.data[5] or len(self.data) != expected:
+            raise ValueError(f"{path} is truncated or corrupt: {len(self.data)} bytes, expected {expected}")
+
+    def lookup(self, positions):
+        return self.data[self.offset + rank_placement(positions, self.cells)]
+
+    def close(self):
+        self.data.close()
+
+
+class PatternDatabaseHeuristic:
+    """Sum of disjoint pattern databases, usable wherever puzzle_Astar takes a heuristic."""
+
+    def __init__(self, databases):
+        self.databases = databases
+        self.cells = databases[0].cells
+        self.database_of = [None] * self.cells
+        for database in databases:
+            for tile in database.tiles:
+                self.database_of[tile] = database
+
+    def _positions(self, state):
+        where = [0] * self.cells
+        for index, tile in enumerate(state):
+            where[tile] = index
+        return where
+
+    def estimate(self, state):
+        where = self._positions(state)
+        return sum(database.lookup([where[tile] for tile in database.tiles]) for database in self.databases)
+
+    def update(self, h, state, blank_index, target_index):
+        """Heuristic value after the tile at target_index slides into blank_index.
+
+        Only the database that owns the moved tile has to be consulted again.
+        """
+        tile = state[target_index]
+        database = self.database_of[tile]
+        if database is None:
+            return h
+        where = self._positions(state)
+        old_value = database.lookup([where[t] for t in database.tiles])
+        where[tile] = blank_index
+        return h - old_value + database.lookup([where[t] for t in database.tiles])
+
+def load_heuristic(directory, size, partition=None):
+    """Heuristic from the databases of partition (DEFAULT_PARTITION[size] if None) in directory."""
+    databases = []
+    for tiles in PARTITIONS[size][partition or DEFAULT_PARTITION[size]]:
+        path = os.path.join(directory, database_filename(size, tiles))
+        database = PatternDatabase(path)
+        if database.size != size or database.tiles != tiles:
+            raise ValueError(f"{path} holds tiles {database.tiles} of a size-{database.size} board, "
+                             f"expected tiles {tiles} of a size-{size} board")
+        databases.append(database)
+    return PatternDatabaseHeuristic(databases)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build additive pattern databases for the sliding-tile puzzle.")
+    parser.add_argument("--size", type=int, default=4, choices=sorted(PARTITIONS))
+    parser.add_argument("--partition", default=None,
+                        help="tile split, e.g. 5-5-5 (the default for size 4), 6-6-3 or 7-8 "
+                             "(7-8 needs hours and several GB in pure Python)")
+    parser.add_argument("--out-dir", default=".")
+    args = parser.parse_args()
+    partition = args.partition or DEFAULT_PARTITION[args.size]
+    if partition not in PARTITIONS[args.size]:
+        parser.error(f"unknown partition {partition} for size {args.size} (choose from {', '.join(PARTITIONS[args.size])})")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    for tiles in PARTITIONS[args.size][partition]:
+        start_time = time.time()
+        table = build_pattern_database(args.size, tiles)
+        path = os.path.join(args.out_dir, database_filename(args.size, tiles))
+        write_pattern_database(path, args.size, tiles, table)
+        print(f"Wrote {path}: {len(table)} entries, max {max(table)} moves, {time.time() - start_time:.1f} seconds")
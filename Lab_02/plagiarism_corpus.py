@@ -0,0 +1,146 @@
+import argparse
+import os
+import time
+import zlib
+
+import numpy as np
+
+from Plagrism import calculate_plagiarism_level, detect_plagiarism, preprocess_text, preprocess_texts
+
+# Universal hashing (a * x + b) mod PRIME over 32-bit shingle hashes stays inside uint64
+PRIME = 4294967291  # Largest prime below 2**32
+SHINGLE_SIZE = 3
+
+def shingle_hashes(sentences, k=SHINGLE_SIZE):
+    """32-bit hashes of every k-word shingle inside each preprocessed sentence.
+
+    Sentences shorter than k words count as a single shingle.
+    """
+    hashes = set()
+    for sentence in sentences:
+        words = sentence.split()
+        if not words:
+            continue
+        for start in range(max(1, len(words) - k + 1)):
+            hashes.add(zlib.crc32(' '.join(words[start:start + k]).encode('utf-8')))
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+class MinHasher:
+    """MinHash signatures with num_perm random hash functions."""
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.a = rng.integers(1, PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.integers(0, PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, sentences):
+        hashes = shingle_hashes(sentences)
+        if len(hashes) == 0:
+            return np.full(self.num_perm, PRIME, dtype=np.uint64)
+        return ((self.a[:, None] * hashes[None, :] + self.b[:, None]) % PRIME).min(axis=1)
+
+
+def band_keys(signature, bands):
+    """Split a signature into bands, each turned into a hashable bucket key."""
+    rows = len(signature) // bands
+    return [signature[band * rows:(band + 1) * rows].tobytes() for band in range(bands)]
+
+def estimated_jaccard(signature1, signature2):
+    return float(np.mean(signature1 == signature2))
+
+
+class MinHashLSHIndex:
+    """Banded LSH over MinHash signatures of whole documents.
+
+    Two documents share a bucket when all rows of any band agree, so documents with
+    high shingle overlap become candidates while the rest are never compared.
+    """
+
+    def __init__(self, num_perm=128, bands=64, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands = bands
+        self.buckets = [{} for _ in range(bands)]
+        self.documents = []  # (name, sentences, signature)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def add(self, name, sentences):
+        doc_id = len(self.documents)
+        signature = self.hasher.signature(sentences)
+        self.documents.append((name, sentences, signature))
+        for buckets, key in zip(self.buckets, band_keys(signature, self.bands)):
+            buckets.setdefault(key, []).append(doc_id)
+        return doc_id
+
+    def query(self, sentences, top_k=5):
+        """Return (candidates, number_of_candidates); candidates are the top_k
+        (doc_id, estimated_jaccard) pairs among all documents sharing a bucket."""
+        signature = self.hasher.signature(sentences)
+        candidate_ids = set()
+        for buckets, key in zip(self.buckets, band_keys(signature, self.bands)):
+            candidate_ids.update(buckets.get(key, ()))
+        scored = [(doc_id, estimated_jaccard(signature, self.documents[doc_id][2])) for doc_id in candidate_ids]
+        scored.sort(key=lambda item: item[1], reverse=True)
+        return scored[:top_k], len(candidate_ids)
+
+def check_against_corpus(index, sentences, top_k=5):
+    """Align a preprocessed submission against its best LSH candidates only.
+
+    Returns (results, stats); each result is (name, estimated_jaccard, plagiarism_level).
+    """
+    start_time = time.perf_counter()
+    candidates, number_of_candidates = index.query(sentences, top_k)
+    query_time = time.perf_counter() - start_time
+
+    results = []
+    for doc_id, jaccard in candidates:
+        name, doc_sentences, _ = index.documents[doc_id]
+        plagiarized_pairs = detect_plagiarism(sentences, doc_sentences)
+        results.append((name, jaccard, calculate_plagiarism_level(plagiarized_pairs)))
+    results.sort(key=lambda result: result[2], reverse=True)
+
+    stats = {
+        "corpus_size": len(index),
+        "candidates": number_of_candidates,
+        "pruning_ratio": 1 - number_of_candidates / len(index) if len(index) else 0.0,
+        "query_time": query_time,
+        "alignment_time": time.perf_counter() - start_time - query_time,
+    }
+    return results, stats
+
+def read_corpus(directory):
+    names = sorted(name for name in os.listdir(directory) if name.endswith('.txt'))
+    texts = []
+    for name in names:
+        with open(os.path.join(directory, name), encoding='utf-8') as f:
+            texts.append(f.read())
+    return names, texts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check one document against a corpus of .txt files.")
+    parser.add_argument("submission", help="text file to check")
+    parser.add_argument("corpus", help="directory of .txt reference documents")
+    parser.add_argument("--top-k", type=int, default=5, help="candidates sent to full alignment")
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--bands", type=int, default=64, help="more bands catch documents with less overlap")
+    args = parser.parse_args()
+
+    names, texts = read_corpus(args.corpus)
+    index = MinHashLSHIndex(args.num_perm, args.bands)
+    for name, sentences in zip(names, preprocess_texts(texts)):
+        index.add(name, sentences)
+
+    with open(args.submission, encoding='utf-8') as f:
+        submission = preprocess_text(f.read())
+
+    results, stats = check_against_corpus(index, submission, args.top_k)
+    for name, jaccard, plagiarism_level in results:
+        print(f"{name}: plagiarism {plagiarism_level * 100:.2f}% (estimated shingle overlap {jaccard:.2f})")
+    print(f"Candidates: {stats['candidates']} of {stats['corpus_size']} documents "
+          f"(pruned {stats['pruning_ratio'] * 100:.2f}%)")
+    print(f"Query latency: {stats['query_time'] * 1000:.2f} ms, alignment: {stats['alignment_time']:.2f} s")
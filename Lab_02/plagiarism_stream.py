@@ -0,0 +1,99 @@
+import argparse
+import re
+
+from Plagrism import SentenceCache, align_sentences, preprocess_texts
+
+# A sentence ends at ., ! or ? followed by whitespace; chunks are only cut there, before
+# normalization strips the punctuation away
+SENTENCE_END = re.compile(r'[.!?]\s+')
+READ_SIZE = 64 * 1024
+
+def find_cut(text, chunk_chars):
+    """Where to end the next chunk of text, which is longer than 2 * chunk_chars."""
+    # First sentence end past chunk_chars, as long as the chunk stays under 2 * chunk_chars
+    match = SENTENCE_END.search(text, chunk_chars)
+    if match is not None and match.end() <= 2 * chunk_chars:
+        return match.end()
+    # Otherwise the last sentence end before it
+    cut = None
+    for match in SENTENCE_END.finditer(text, 0, chunk_chars):
+        cut = match.end()
+    if cut is not None:
+        return cut
+    # No sentence ends at all: fall back to the last space, or a hard cut
+    return text.rfind(' ', 0, 2 * chunk_chars) + 1 or 2 * chunk_chars
+
+def iter_sentence_chunks(path, chunk_chars=100_000):
+    """Yield pieces of a text file of at most 2 * chunk_chars characters, cut at sentence ends.
+
+    Only one piece plus one read block is held in memory at a time.
+    """
+    buffer = ''
+    end_of_file = False
+    with open(path, encoding='utf-8') as f:
+        while buffer or not end_of_file:
+            if not end_of_file and len(buffer) <= 2 * chunk_chars:
+                block = f.read(READ_SIZE)
+                buffer += block
+                end_of_file = not block
+                continue
+            if len(buffer) <= 2 * chunk_chars:
+                yield buffer
+                return
+            cut = find_cut(buffer, chunk_chars)
+            yield buffer[:cut]
+            buffer = buffer[cut:]
+
+def iter_sentences(path, chunk_chars=100_000):
+    """Preprocessed sentences of a file, produced one chunk at a time."""
+    # Keeping chunks in the shared sentence cache would make memory grow with the file
+    cache = SentenceCache(max_entries=0)
+    for chunk in iter_sentence_chunks(path, chunk_chars):
+        yield from preprocess_texts([chunk], cache=cache)[0]
+
+def stream_plagiarism(path1, path2, window=200, chunk_chars=100_000):
+    """Align two documents window by window and yield the running plagiarism level.
+
+    At most `window` preprocessed sentences of each document are held for alignment at
+    a time, so memory does not grow with document length. Sentences are only aligned
+    within the same window, so a copied passage that straddles a window boundary can
+    be scored lower than a whole-document alignment would score it.
+    """
+    sentences1 = iter_sentences(path1, chunk_chars)
+    sentences2 = iter_sentences(path2, chunk_chars)
+    total_similarity = 0.0
+    num_pairs = 0
+    seen1 = seen2 = 0
+
+    while True:
+        window1 = [sentence for _, sentence in zip(range(window), sentences1)]
+        window2 = [sentence for _, sentence in zip(range(window), sentences2)]
+        if not window1 and not window2:
+            break
+        seen1 += len(window1)
+        seen2 += len(window2)
+
+        for _, _, similarity in align_sentences(window1, window2):
+            total_similarity += similarity
+            num_pairs += 1
+        yield {
+            "sentences1": seen1,
+            "sentences2": seen2,
+            "pairs": num_pairs,
+            "plagiarism_level": total_similarity / num_pairs if num_pairs else 0.0,
+        }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plagiarism level of two large text files, computed in bounded memory.")
+    parser.add_argument("file1")
+    parser.add_argument("file2")
+    parser.add_argument("--window", type=int, default=200, help="sentences per document aligned at a time")
+    parser.add_argument("--chunk-chars", type=int, default=100_000, help="characters sent to spaCy at a time")
+    args = parser.parse_args()
+
+    progress = None
+    for progress in stream_plagiarism(args.file1, args.file2, args.window, args.chunk_chars):
+        print(f"{progress['sentences1']} / {progress['sentences2']} sentences: "
+              f"running plagiarism level {progress['plagiarism_level'] * 100:.2f}%", flush=True)
+    if progress is not None:
+        print(f"Overall level of plagiarism: {progress['plagiarism_level'] * 100:.2f}%")
@@ -0,0 +1,299 @@
+import argparse
+import heapq
+import itertools
+import time
+import tracemalloc
+
+from pattern_database import DEFAULT_PARTITION, PARTITIONS, load_heuristic
+
+
+def make_goal_state(size):
+    """Goal for an N x N board: tiles in order with the blank (0) last."""
+    return list(range(1, size * size)) + [0]
+
+def make_neighbors(size):
+    """For every blank position, the positions it can swap with (up, down, left, right)."""
+    neighbors = []
+    for blank_index in range(size * size):
+        row, col = divmod(blank_index, size)
+        targets = []
+        for d_row, d_col in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            new_row, new_col = row + d_row, col + d_col
+            if 0 <= new_row < size and 0 <= new_col < size:
+                targets.append(new_row * size + new_col)
+        neighbors.append(tuple(targets))
+    return neighbors
+
+def is_solvable(state, size):
+    """Inversion-parity test; for size 3 this is exactly puzzle_Bfs.is_solvable."""
+    tiles = [tile for tile in state if tile != 0]
+    inversions = 0
+    for i in range(len(tiles)):
+        for j in range(i + 1, len(tiles)):
+            if tiles[i] > tiles[j]:
+                inversions += 1
+    if size % 2 == 1:
+        return inversions % 2 == 0
+    # On even boards every vertical move changes the inversion parity, so the row of
+    # the blank (counted from the bottom) has to be taken into account as well
+    blank_row_from_bottom = size - state.index(0) // size
+    return (inversions + blank_row_from_bottom) % 2 == 1
+
+
+class ManhattanHeuristic:
+    """Sum of Manhattan distances of every tile to its goal position."""
+
+    def __init__(self, size):
+        self.size = size
+        goal = make_goal_state(size)
+        self.goal_row = [0] * (size * size)
+        self.goal_col = [0] * (size * size)
+        for index, tile in enumerate(goal):
+            self.goal_row[tile], self.goal_col[tile] = divmod(index, size)
+        # distance[tile][position], so a move only needs two table lookups
+        self.distance = [[0] * (size * size) for _ in range(size * size)]
+        for tile in range(1, size * size):
+            for position in range(size * size):
+                row, col = divmod(position, size)
+                self.distance[tile][position] = abs(row - self.goal_row[tile]) + abs(col - self.goal_col[tile])
+
+    def estimate(self, state):
+        return sum(self.distance[tile][position] for position, tile in enumerate(state) if tile != 0)
+
+    def update(self, h, state, blank_index, target_index):
+        """Heuristic value after the tile at target_index slides into blank_index.
+
+        state is the board before the move.
+        """
+        distance = self.distance[state[target_index]]
+        return h - distance[target_index] + distance[blank_index]
+
+
+class LinearConflictHeuristic(ManhattanHeuristic):
+    """Manhattan distance plus two moves for every tile that has to leave its row or
+    column to let another tile of that line pass.
+
+    For each line the number of such tiles is the line length minus the longest
+    increasing run of goal positions, and it is cached per line content.
+    """
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.row_cache = {}
+        self.col_cache = {}
+
+    def _conflicts(self, line, index, goal_line, goal_place, cache):
+        tiles = tuple(tile for tile in line if tile != 0 and goal_line[tile] == index)
+        conflicts = cache.get(tiles)
+        if conflicts is None:
+            # Longest increasing subsequence of goal places; everything else must move aside
+            longest = [1] * len(tiles)
+            for i in range(len(tiles)):
+                for j in range(i):
+                    if goal_place[tiles[j]] < goal_place[tiles[i]] and longest[j] + 1 > longest[i]:
+                        longest[i] = longest[j] + 1
+            conflicts = 2 * (len(tiles) - max(longest, default=0))
+            cache[tiles] = conflicts
+        return conflicts
+
+    def row_conflicts(self, line, row):
+        return self._conflicts(line, row, self.goal_row, self.goal_col, self.row_cache)
+
+    def col_conflicts(self, line, col):
+        return self._conflicts(line, col, self.goal_col, self.goal_row, self.col_cache)
+
+    def estimate(self, state):
+        size = self.size
+        h = super().estimate(state)
+        for index in range(size):
+            h += self.row_conflicts(state[index * size:(index + 1) * size], index)
+            h += self.col_conflicts(state[index::size], index)
+        return h
+
+    def update(self, h, state, blank_index, target_index):
+        size = self.size
+        tile = state[target_index]
+        h = super().update(h, state, blank_index, target_index)
+        blank_row, blank_col = divmod(blank_index, size)
+        target_row, target_col = divmod(target_index, size)
+
+        # A horizontal move keeps the order inside the tile's row, so only the two
+        # columns change; a vertical move only changes the two rows.
+        if blank_row == target_row:
+            lines = [(state[target_col::size], target_col), (state[blank_col::size], blank_col)]
+            conflicts = self.col_conflicts
+        else:
+            lines = [(state[target_row * size:(target_row + 1) * size], target_row),
+                     (state[blank_row * size:(blank_row + 1) * size], blank_row)]
+            conflicts = self.row_conflicts
+        (old_line, old_index), (new_line, new_index) = lines
+        h -= conflicts(old_line, old_index) + conflicts(new_line, new_index)
+        h += conflicts([0 if value == tile else value for value in old_line], old_index)
+        h += conflicts([tile if value == 0 else value for value in new_line], new_index)
+        return h
+
+
+HEURISTICS = {
+    "manhattan": ManhattanHeuristic,
+    "linear_conflict": LinearConflictHeuristic,
+}
+
+def a_star(start_state, size, heuristic):
+    """A* search. Returns (path, nodes_explored); path is a list of states or None."""
+    neighbors = make_neighbors(size)
+    start = tuple(start_state)
+    goal = tuple(make_goal_state(size))
+    start_h = heuristic.estimate(start)
+    counter = itertools.count()
+    open_set = [(start_h, 0, next(counter), start, start.index(0), start_h)]
+    g_score = {start: 0}
+    came_from = {start: None}
+    nodes_explored = 0
+
+    while open_set:
+        _, g, _, state, blank_index, h = heapq.heappop(open_set)
+        if g > g_score[state]:
+            continue  # A cheaper copy of this state was already expanded
+        nodes_explored += 1
+
+        if state == goal:
+            path = []
+            while state is not None:
+                path.append(list(state))
+                state = came_from[state]
+            return path[::-1], nodes_explored
+
+        for target_index in neighbors[blank_index]:
+            new_h = heuristic.update(h, state, blank_index, target_index)
+            new_state = list(state)
+            new_state[blank_index], new_state[target_index] = new_state[target_index], 0
+            new_state = tuple(new_state)
+            new_g = g + 1
+            if new_g < g_score.get(new_state, new_g + 1):
+                g_score[new_state] = new_g
+                came_from[new_state] = state
+                heapq.heappush(open_set, (new_g + new_h, new_g, next(counter), new_state, target_index, new_h))
+
+    return None, nodes_explored
+
+def ida_star(start_state, size, heuristic):
+    """IDA* search on a single board mutated in place.
+
+    Memory is linear in the solution depth. Returns (path, nodes_explored).
+    """
+    neighbors = make_neighbors(size)
+    state = list(start_state)
+    goal = make_goal_state(size)
+    blank_path = [state.index(0)]
+    nodes_explored = 0
+
+    def search(g, h, bound):
+        # Returns -1 when the goal is reached, otherwise the smallest f above bound
+        nonlocal nodes_explored
+        f = g + h
+        if f > bound:
+            return f
+        nodes_explored += 1
+        if h == 0 and state == goal:
+            return -1
+
+        blank_index = blank_path[-1]
+        previous_blank = blank_path[-2] if len(blank_path) > 1 else -1
+        minimum = float('inf')
+        for target_index in neighbors[blank_index]:
+            if target_index == previous_blank:
+                continue  # Never undo the previous move
+            new_h = heuristic.update(h, state, blank_index, target_index)
+            state[blank_index], state[target_index] = state[target_index], 0
+            blank_path.append(target_index)
+            result = search(g + 1, new_h, bound)
+            if result == -1:
+                return -1
+            blank_path.pop()
+            state[target_index], state[blank_index] = state[blank_index], 0
+            minimum = min(minimum, result)
+        return minimum
+
+    start_h = heuristic.estimate(state)
+    bound = start_h
+    while True:
+        result = search(0, start_h, bound)
+        if result == -1:
+            break
+        if result == float('inf'):
+            return None, nodes_explored
+        bound = result
+
+    # Replay the blank moves to rebuild the list of states
+    board = list(start_state)
+    path = [board[:]]
+    for blank_index, target_index in zip(blank_path, blank_path[1:]):
+        board[blank_index], board[target_index] = board[target_index], 0
+        path.append(board[:])
+    return path, nodes_explored
+
+def print_solution(solution, size):
+    """Print the solution steps in a readable format."""
+    for step_num, step in enumerate(solution, start=1):
+        print(f"Step {step_num}:")
+        for i in range(0, size * size, size):
+            print(step[i:i + size])
+        print()
+
+# Input validation function
+def get_valid_input(size):
+    count = size * size
+    while True:
+        try:
+            start_state = [int(x) for x in input(f"Enter the start state of the puzzle ({count} space-separated numbers from 0-{count - 1}): ").split()]
+            if len(start_state) != count or set(start_state) != set(range(count)):
+                raise ValueError
+            return start_state
+        except ValueError:
+            print(f"Invalid input. Please enter exactly {count} numbers between 0 and {count - 1}, with no duplicates.")
+
+# Main execution with memory tracking
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Informed search for the N x N sliding-tile puzzle.")
+    parser.add_argument("--size", type=int, default=3, help="board width (3 for the 8-puzzle, 4 for the 15-puzzle)")
+    parser.add_argument("--algorithm", choices=["astar", "idastar"], default="astar")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS) + ["pdb"], default="linear_conflict")
+    parser.add_argument("--pdb-dir", default=".", help="directory written by pattern_database.py")
+    parser.add_argument("--partition", default=None,
+                        help="pattern database tile split (default: the one pattern_database.py builds by default, "
+                             + ", ".join(f"{split} for size {size}" for size, split in DEFAULT_PARTITION.items()) + ")")
+    args = parser.parse_args()
+    if args.heuristic == "pdb":
+        if args.size not in PARTITIONS:
+            parser.error(f"no pattern databases for size {args.size}")
+        if args.partition is not None and args.partition not in PARTITIONS[args.size]:
+            parser.error(f"unknown partition {args.partition} (choose from {', '.join(PARTITIONS[args.size])})")
+
+    start_state = get_valid_input(args.size)
+
+    if is_solvable(start_state, args.size):
+        if args.heuristic == "pdb":
+            heuristic = load_heuristic(args.pdb_dir, args.size, args.partition)
+        else:
+            heuristic = HEURISTICS[args.heuristic](args.size)
+        search = a_star if args.algorithm == "astar" else ida_star
+
+        tracemalloc.start()
+        start_time = time.time()
+
+        solution, nodes_explored = search(start_state, args.size, heuristic)
+
+        end_time = time.time()
+        memory_peak = tracemalloc.get_traced_memory()[1] / 1024  # Convert to KB
+        tracemalloc.stop()
+
+        if solution:
+            print(f"Solution found! Total nodes explored: {nodes_explored}")
+            print("Solution path:")
+            print_solution(solution, args.size)
+            print(f"Moves: {len(solution) - 1}")
+        else:
+            print("No solution found.")
+        print(f"Time taken: {end_time - start_time:.4f} seconds, peak memory: {memory_peak:.2f} KB")
+    else:
+        print("The given start state is not solvable.")
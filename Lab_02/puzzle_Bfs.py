@@ -41,8 +41,11 @@ def is_solvable(state):
                 inversions += 1
     return inversions % 2 == 0
 
-def bfs(start_state, goal_state):
-    """Perform Breadth-First Search (BFS) to find the shortest solution path."""
+def bfs_search(start_state, goal_state):
+    """Run Breadth-First Search (BFS) to find the shortest solution path.
+
+    Returns (path, nodes_explored); path is None when no solution exists.
+    """
     start_node = Node(start_state)
     goal_node = Node(goal_state)
     queue = deque([start_node])
@@ -62,15 +65,22 @@ def bfs(start_state, goal_state):
             while node:
                 path.append(node.state)
                 node = node.parent
-            print(f"Solution found! Total nodes explored: {nodes_explored}")
-            return path[::-1]
+            return path[::-1], nodes_explored
 
         for successor in get_successors(node):
             if tuple(successor.state) not in visited:
                 queue.append(successor)
 
-    print(f"No solution found. Total nodes explored: {nodes_explored}")
-    return None
+    return None, nodes_explored
+
+def bfs(start_state, goal_state):
+    """Perform Breadth-First Search (BFS) to find the shortest solution path."""
+    path, nodes_explored = bfs_search(start_state, goal_state)
+    if path is not None:
+        print(f"Solution found! Total nodes explored: {nodes_explored}")
+    else:
+        print(f"No solution found. Total nodes explored: {nodes_explored}")
+    return path
 
 def print_solution(solution):
     """Print the solution steps in a readable format."""
@@ -110,5 +120,6 @@ if __name__ == "__main__":
             print_solution(solution)
         else:
             print("No solution found.")
+        print(f"Time taken: {end_time - start_time:.4f} seconds, peak memory: {memory_peak:.2f} KB")
     else:
         print("The given start state is not solvable.")
@@ -0,0 +1,89 @@
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from multiprocessing import Pool
+
+from Puzzle_Dfs import dfs_search
+from puzzle_Astar import HEURISTICS, a_star
+from puzzle_Bfs import bfs_search, goal_state, is_solvable
+
+def astar_search(start_state, goal_state):
+    return a_star(start_state, 3, HEURISTICS["linear_conflict"](3))
+
+SEARCHES = {
+    "bfs": bfs_search,
+    "dfs": dfs_search,
+    "astar": astar_search,
+}
+
+def parse_state(line):
+    """Parse one line of 9 numbers (spaces or commas); raises ValueError on bad input."""
+    state = [int(x) for x in line.replace(",", " ").split()]
+    if len(state) != 9 or set(state) != set(range(9)):
+        raise ValueError("expected 9 distinct numbers from 0-8")
+    return state
+
+def solve_line(task):
+    """Solve one input line inside a worker process and return its JSON-ready result."""
+    index, line, algorithm = task
+    result = {"index": index, "input": line}
+    try:
+        start_state = parse_state(line)
+    except ValueError as error:
+        result["error"] = str(error)
+        return result
+
+    result["solvable"] = is_solvable(start_state)
+    if not result["solvable"]:
+        return result
+
+    tracemalloc.start()
+    start_time = time.time()
+    solution, nodes_explored = SEARCHES[algorithm](start_state, goal_state)
+    end_time = time.time()
+    memory_peak = tracemalloc.get_traced_memory()[1] / 1024  # Convert to KB
+    tracemalloc.stop()
+
+    result["solution_length"] = len(solution) - 1 if solution else None
+    result["nodes_explored"] = nodes_explored
+    result["time"] = end_time - start_time
+    result["peak_memory_kb"] = memory_peak
+    return result
+
+def read_tasks(lines, algorithm):
+    for index, line in enumerate(lines):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield index, line, algorithm
+
+def run_batch(lines, output, algorithm="bfs", workers=None):
+    """Solve every start state in lines on a process pool, writing results as they finish."""
+    count = 0
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(solve_line, read_tasks(lines, algorithm)):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            count += 1
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solve many 8-puzzle start states, one per line.")
+    parser.add_argument("input", nargs="?", default="-", help="file with one start state per line, '-' for stdin")
+    parser.add_argument("--output", default="-", help="JSONL output file, '-' for stdout")
+    parser.add_argument("--algorithm", choices=sorted(SEARCHES), default="bfs")
+    parser.add_argument("--workers", type=int, default=None, help="number of processes (default: CPU count)")
+    args = parser.parse_args()
+
+    lines = sys.stdin if args.input == "-" else open(args.input)
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        start_time = time.time()
+        count = run_batch(lines, output, args.algorithm, args.workers)
+        print(f"Solved {count} puzzles in {time.time() - start_time:.2f} seconds", file=sys.stderr)
+    finally:
+        if lines is not sys.stdin:
+            lines.close()
+        if output is not sys.stdout:
+            output.close()
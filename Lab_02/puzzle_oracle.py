@@ -0,0 +1,125 @@
+import argparse
+import os
+import time
+from collections import deque
+from math import factorial
+
+from puzzle_Bfs import goal_state, is_solvable, get_valid_input, print_solution
+
+# A solvable 8-puzzle state is a blank position (9 choices) plus an even permutation of
+# the eight tiles (8!/2 = 20160 choices), so every state gets a rank in 0..181439.
+EVEN_PERMUTATIONS = factorial(8) // 2
+STATE_COUNT = 9 * EVEN_PERMUTATIONS
+UNKNOWN = 255
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "puzzle_oracle.bin")
+
+# Blank position -> positions it can swap with (up, down, left, right)
+NEIGHBORS = [tuple(new_row * 3 + new_col
+                   for new_row, new_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1))
+                   if 0 <= new_row < 3 and 0 <= new_col < 3)
+             for row, col in (divmod(index, 3) for index in range(9))]
+
+def rank_state(state):
+    """Lehmer-code rank of a solvable state.
+
+    The tiles' Lehmer digits sum to their inversion count, which is even for solvable
+    states, so the second-to-last digit is implied by the others and can be dropped.
+    """
+    tiles = [tile for tile in state if tile != 0]
+    rank = 0
+    for i in range(6):
+        smaller = 0
+        for later in tiles[i + 1:]:
+            if later < tiles[i]:
+                smaller += 1
+        rank += smaller * factorial(7 - i)
+    return state.index(0) * EVEN_PERMUTATIONS + rank // 2
+
+def build_distance_table():
+    """One backward BFS from goal_state; returns a bytearray of optimal distances by rank.
+
+    Every move can be undone, so distances from the goal equal distances to it.
+    """
+    table = bytearray([UNKNOWN]) * STATE_COUNT
+    goal = tuple(goal_state)
+    table[rank_state(goal)] = 0
+    queue = deque([goal])
+    while queue:
+        state = queue.popleft()
+        distance = table[rank_state(state)] + 1
+        blank_index = state.index(0)
+        for target_index in NEIGHBORS[blank_index]:
+            new_state = list(state)
+            new_state[blank_index], new_state[target_index] = new_state[target_index], 0
+            rank = rank_state(new_state)
+            if table[rank] == UNKNOWN:
+                table[rank] = distance
+                queue.append(tuple(new_state))
+    return table
+
+def save_distance_table(table, path=DEFAULT_PATH):
+    with open(path, "wb") as f:
+        f.write(table)
+
+def load_distance_table(path=DEFAULT_PATH):
+    with open(path, "rb") as f:
+        table = f.read()
+    if len(table) != STATE_COUNT:
+        raise ValueError(f"{path} does not hold {STATE_COUNT} distances")
+    return table
+
+
+class DistanceOracle:
+    """Constant-time optimal distance and next-move queries for solvable 8-puzzle states."""
+
+    def __init__(self, table):
+        self.table = table
+
+    @classmethod
+    def load_or_build(cls, path=DEFAULT_PATH):
+        """Load the table from path, building and saving it first if it does not exist."""
+        if not os.path.exists(path):
+            save_distance_table(build_distance_table(), path)
+        return cls(load_distance_table(path))
+
+    def distance(self, state):
+        return self.table[rank_state(state)]
+
+    def next_move(self, state):
+        """The successor state one move closer to the goal, or None at the goal."""
+        distance = self.distance(state)
+        if distance == 0:
+            return None
+        blank_index = state.index(0)
+        for target_index in NEIGHBORS[blank_index]:
+            new_state = list(state)
+            new_state[blank_index], new_state[target_index] = new_state[target_index], 0
+            if self.distance(new_state) == distance - 1:
+                return new_state
+
+    def solve(self, state):
+        """Optimal solution path from state to goal_state, following next_move."""
+        path = [list(state)]
+        while (state := self.next_move(path[-1])) is not None:
+            path.append(state)
+        return path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact 8-puzzle distances from a precomputed table.")
+    parser.add_argument("--table", default=DEFAULT_PATH, help="distance table file (built on first use)")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the table even if it exists")
+    args = parser.parse_args()
+
+    if args.rebuild or not os.path.exists(args.table):
+        start_time = time.time()
+        save_distance_table(build_distance_table(), args.table)
+        print(f"Built {args.table} in {time.time() - start_time:.2f} seconds")
+    oracle = DistanceOracle(load_distance_table(args.table))
+
+    start_state = get_valid_input()
+    if is_solvable(start_state):
+        print(f"Optimal number of moves: {oracle.distance(start_state)}")
+        print("Solution path:")
+        print_solution(oracle.solve(start_state))
+    else:
+        print("The given start state is not solvable.")
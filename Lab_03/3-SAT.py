@@ -1,4 +1,12 @@
 import random
+import sys
+
+import local_search
+from cdcl import cdcl
+from dimacs import read_dimacs
+from local_search import gsat, walksat
+from portfolio import run_portfolio
+from vectorized_beam import vectorized_beam_search
 
 def generate_3sat_problem(n, m):
     clauses = []
@@ -38,79 +46,64 @@ def hill_climbing(clauses, n):
             break
     return None  # No solution found
 
-def beam_search(clauses, n, beam_width):
-    current_solutions = [[random.choice([True, False]) for _ in range(n)] for _ in range(beam_width)]
-    
-    while True:
-        new_solutions = []
-        for solution in current_solutions:
-            if evaluate_solution(solution, clauses):
-                return solution
-            
-            for i in range(n):
-                neighbor = solution[:]
-                neighbor[i] = not neighbor[i]
-                new_solutions.append(neighbor)
-
-        # Keep the best solutions based on the number of satisfied clauses
-        current_solutions = sorted(new_solutions, key=lambda s: count_satisfied_clauses(s, clauses), reverse=True)[:beam_width]
-        
-        if not current_solutions:
-            break  # No solutions found
-    return None
+def beam_search(clauses, n, beam_width, max_iterations=1000):
+    # The whole beam is scored at once with NumPy, see vectorized_beam.py
+    return vectorized_beam_search(clauses, n, beam_width, max_iterations, seed=random.getrandbits(32))
 
 def variable_neighborhood_descent(clauses, n):
-    def neighborhood1(solution):
-        return [solution[:i] + [not solution[i]] + solution[i + 1:] for i in range(n)]
-    
-    def neighborhood2(solution):
-        return [solution[:i] + [not solution[i]] + solution[:j] + solution[j + 1:] for i in range(n) for j in range(i + 1, n)]
-    
-    def neighborhood3(solution):
-        return [solution[:i] + [not solution[i]] + solution for i in range(n)]
-    
-    neighborhoods = [neighborhood1, neighborhood2, neighborhood3]
-    current_solution = [random.choice([True, False]) for _ in range(n)]
+    # 1-, 2- and 3-flip neighborhoods, generated lazily and scored incrementally
+    return local_search.variable_neighborhood_descent(clauses, n, max_k=3, seed=random.getrandbits(32))[0]
 
-    while True:
-        if evaluate_solution(current_solution, clauses):
-            return current_solution
-        
-        best_solution = current_solution
-        for neighborhood in neighborhoods:
-            for neighbor in neighborhood(current_solution):
-                if evaluate_solution(neighbor, clauses):
-                    return neighbor
-                if count_satisfied_clauses(neighbor, clauses) > count_satisfied_clauses(best_solution, clauses):
-                    best_solution = neighbor
-        
-        if best_solution == current_solution:
-            break
-        current_solution = best_solution
-
-    return None  # No solution found
+def print_result(name, solution, clauses, m, details=None):
+    # Incomplete solvers return None when they give up
+    if solution is None:
+        print(f"{name}: no solution found" + (f" ({details})" if details else ""))
+    else:
+        extra = f", {details}" if details else ""
+        print(f"{name} solution:", [int(x) for x in solution], ", Satisfied clauses:", count_satisfied_clauses(solution, clauses), "/", f"{m}{extra}")
 
-def compare_performance():
-    n = int(input("Enter the number of variables: "))
-    m = int(input("Enter the number of clauses: "))
+def compare_performance(path=None):
+    if path is None:
+        n = int(input("Enter the number of variables: "))
+        m = int(input("Enter the number of clauses: "))
     beam_width = int(input("Enter the beam width: "))
     
-    clauses = generate_3sat_problem(n, m)
-    
-    print("Variables are:", [f'v{i+1}' for i in range(n)])
-    
-    # Print generated expression
-    expression = ' & '.join(f'({"|".join(f"(!v{abs(var)})" if var < 0 else f"v{var}" for var in clause)})' for clause in clauses)
-    print("Expression Generated is:", expression)
+    if path is None:
+        clauses = generate_3sat_problem(n, m)
+
+        print("Variables are:", [f'v{i+1}' for i in range(n)])
+
+        # Print generated expression
+        expression = ' & '.join(f'({"|".join(f"(!v{abs(var)})" if var < 0 else f"v{var}" for var in clause)})' for clause in clauses)
+        print("Expression Generated is:", expression)
+    else:
+        # Instance from a DIMACS CNF file
+        clauses = read_dimacs(path)
+        n, m = clauses.n, len(clauses)
+        print(f"Loaded {path}: {n} variables, {m} clauses")
     
-    hill_climbing_solution = hill_climbing(clauses, n)
-    print("Hill Climbing solution:", [int(x) for x in hill_climbing_solution], ", Satisfied clauses:", count_satisfied_clauses(hill_climbing_solution, clauses), "/", m)
+    print_result("Hill Climbing", hill_climbing(clauses, n), clauses, m)
+    print_result("Beam Search", beam_search(clauses, n, beam_width), clauses, m)
+    print_result("Variable Neighborhood Descent", variable_neighborhood_descent(clauses, n), clauses, m)
+
+    for name, solver in [("GSAT", gsat), ("WalkSAT", walksat)]:
+        solution, flips = solver(clauses, n)
+        print_result(name, solution, clauses, m, f"Flips: {flips}")
 
-    beam_search_solution = beam_search(clauses, n, beam_width)
-    print("Beam Search solution:", [int(x) for x in beam_search_solution], ", Satisfied clauses:", count_satisfied_clauses(beam_search_solution, clauses), "/", m)
+    # CDCL is complete, so no solution means the formula is unsatisfiable
+    solution, conflicts = cdcl(clauses, n)
+    if solution is None:
+        print(f"CDCL: formula is unsatisfiable, proved after {conflicts} conflicts")
+    else:
+        print_result("CDCL", solution, clauses, m, f"Conflicts: {conflicts}")
 
-    variable_neighborhood_solution = variable_neighborhood_descent(clauses, n)
-    print("Variable Neighborhood Descent solution:", [int(x) for x in variable_neighborhood_solution], ", Satisfied clauses:", count_satisfied_clauses(variable_neighborhood_solution, clauses), "/", m)
+    # The same solvers again, racing in parallel with restarts
+    outcome = run_portfolio(clauses, n, budget=30.0)
+    if outcome["status"] == "SAT":
+        print_result("Portfolio", outcome["solution"], clauses, m, f"Winner: {outcome['solver']} in {outcome['time']:.2f} s")
+    else:
+        print(f"Portfolio: {outcome['status']} after {outcome['time']:.2f} s")
 
-# Run the performance comparison with user input
-compare_performance()
+# Run the performance comparison with user input, or on a DIMACS .cnf file given as argument
+if __name__ == "__main__":
+    compare_performance(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -1,110 +1,126 @@
 import heapq
+import itertools
 import time
 
-# Directions for the movement in the game (up, down, left, right)
-MOVES = [(2, 0), (-2, 0), (0, 2), (0, -2)]
-
-# Helper function to clone the board
-def clone_board(board):
-    return [row[:] for row in board]
-
-# Helper function to check if a move is valid
-def is_valid_move(board, x, y, dx, dy):
-    if 0 <= x + dx < len(board) and 0 <= y + dy < len(board[0]):
-        mid_x, mid_y = x + dx // 2, y + dy // 2
-        return board[x][y] == 1 and board[x + dx][y + dy] == 0 and board[mid_x][mid_y] == 1
-    return False
-
-# Apply the move (jump over a marble)
-def apply_move(board, x, y, dx, dy):
-    new_board = clone_board(board)
-    mid_x, mid_y = x + dx // 2, y + dy // 2
-    new_board[x][y] = 0
-    new_board[mid_x][mid_y] = 0
-    new_board[x + dx][y + dy] = 1
-    return new_board
+from marble_bitboard import (CENTER, board_from_grid, can_reach_center, canonical_board, count_marbles,
+                             keyed_successors, manhattan_distance)
 
 # Heuristic 1: Number of remaining marbles
 def heuristic_num_marbles(board):
-    return sum(sum(1 for cell in row if cell == 1) for row in board)
+    return count_marbles(board)
 
 # Heuristic 2: Total Manhattan distance to the center
 def heuristic_manhattan(board):
-    center = (3, 3)
-    total_distance = 0
-    for x in range(len(board)):
-        for y in range(len(board[0])):
-            if board[x][y] == 1:
-                total_distance += abs(center[0] - x) + abs(center[1] - y)
-    return total_distance
+    return manhattan_distance(board)
 
 # Combined heuristic: Number of marbles + Manhattan distance
 def combined_heuristic(board):
     return heuristic_num_marbles(board) + heuristic_manhattan(board)
 
+# Key of a board in the visited set. The goal is symmetric, so a rotated or reflected
+# copy of a board already seen needs no second visit; boards and moves themselves
+# stay in the real orientation. Heap ties are broken on the key too, so the search
+# order does not depend on which orientation of a board happened to be reached first.
+def visited_key(board, symmetry):
+    return canonical_board(board) if symmetry else board
+
+# Paths are stored as parent pointers: a link is (move, parent link), so every board
+# pushed from the same parent shares one copy of the path leading to it
+def path_from(link):
+    path = []
+    while link is not None:
+        move, link = link
+        path.append(move)
+    path.reverse()
+    return path
+
+# Memory-capped mode (SMA*-style) for a budget of max_nodes boards: when the frontier
+# grows past it, its worst quarter by priority is dropped, and when the visited table
+# does, its oldest quarter is forgotten. A forgotten board may be reached and pushed
+# again later; every jump removes a marble, so the search still ends.
+def trim_frontier(pq, visited, max_nodes):
+    keep = max_nodes * 3 // 4
+    pq.sort()  # A sorted list is still a valid heap
+    for entry in pq[keep:]:
+        visited.pop(entry[1], None)
+    del pq[keep:]
+
+def trim_visited(visited, max_nodes):
+    for key in list(itertools.islice(visited, len(visited) - max_nodes * 3 // 4)):
+        del visited[key]  # Dicts keep insertion order, so these are the oldest
+
 # Priority queue-based search algorithm for Best-First Search (ignoring path cost)
-def best_first_search(board, heuristic):
+def best_first_search(board, heuristic, symmetry=True, pagoda=True, max_nodes=None):
+    board = board_from_grid(board)  # Searched as a 33-bit integer, see marble_bitboard.py
+    key = visited_key(board, symmetry)
+    counter = itertools.count()  # Keeps ties from reaching the paths
     pq = []
     initial_cost = heuristic(board)
-    heapq.heappush(pq, (initial_cost, board, []))  # (heuristic cost, board, path)
+    heapq.heappush(pq, (initial_cost, key, next(counter), board, None))  # (heuristic cost, visited key, counter, board, path link)
     
-    visited = set()
-    visited.add(tuple(map(tuple, board)))
+    visited = {key: None}  # Used as an ordered set
     nodes_expanded = 0
 
     while pq:
         nodes_expanded += 1
-        _, current_board, path = heapq.heappop(pq)
+        _, _, _, current_board, link = heapq.heappop(pq)
 
         # Check if solution (only one marble in the center)
-        if heuristic_num_marbles(current_board) == 1 and current_board[3][3] == 1:
-            return path, nodes_expanded
+        if current_board == CENTER:
+            return path_from(link), nodes_expanded
         
-        for x in range(len(current_board)):
-            for y in range(len(current_board[0])):
-                if current_board[x][y] == 1:
-                    for dx, dy in MOVES:
-                        if is_valid_move(current_board, x, y, dx, dy):
-                            new_board = apply_move(current_board, x, y, dx, dy)
-                            new_board_tuple = tuple(map(tuple, new_board))
-                            if new_board_tuple not in visited:
-                                visited.add(new_board_tuple)
-                                heapq.heappush(pq, (heuristic(new_board), new_board, path + [(x, y, dx, dy)]))
+        for new_board, new_key, move in keyed_successors(current_board, symmetry):
+            if new_key not in visited:
+                visited[new_key] = None
+                # Skip boards a pagoda function proves cannot end with one marble in the center
+                if pagoda and not can_reach_center(new_board):
+                    continue
+                heapq.heappush(pq, (heuristic(new_board), new_key, next(counter), new_board, (move, link)))
+        if max_nodes is not None:
+            if len(pq) > max_nodes:
+                trim_frontier(pq, visited, max_nodes)
+            if len(visited) > max_nodes:
+                trim_visited(visited, max_nodes)
 
     return None, nodes_expanded
 
 # Priority queue-based search algorithm for A* (considering both heuristic and path cost)
-def a_star_search(board, heuristic):
+def a_star_search(board, heuristic, symmetry=True, pagoda=True, max_nodes=None):
+    board = board_from_grid(board)
+    key = visited_key(board, symmetry)
+    counter = itertools.count()
     pq = []
     initial_cost = heuristic(board) + 0  # Start path cost is zero
-    heapq.heappush(pq, (initial_cost, board, 0, []))  # (heuristic + path cost, board, path cost, path)
+    heapq.heappush(pq, (initial_cost, key, next(counter), board, 0, None))  # (heuristic + path cost, visited key, counter, board, path cost, path link)
     
-    visited = set()
-    visited.add(tuple(map(tuple, board)))
+    visited = {key: None}
     nodes_expanded = 0
 
     while pq:
         nodes_expanded += 1
-        _, current_board, current_cost, path = heapq.heappop(pq)
+        _, _, _, current_board, current_cost, link = heapq.heappop(pq)
 
         # Check if solution (only one marble in the center)
-        if heuristic_num_marbles(current_board) == 1 and current_board[3][3] == 1:
-            return path, current_cost, nodes_expanded
+        if current_board == CENTER:
+            return path_from(link), current_cost, nodes_expanded
         
-        for x in range(len(current_board)):
-            for y in range(len(current_board[0])):
-                if current_board[x][y] == 1:
-                    for dx, dy in MOVES:
-                        if is_valid_move(current_board, x, y, dx, dy):
-                            new_board = apply_move(current_board, x, y, dx, dy)
-                            new_board_tuple = tuple(map(tuple, new_board))
-                            if new_board_tuple not in visited:
-                                visited.add(new_board_tuple)
-                                new_cost = current_cost + 1
-                                heapq.heappush(pq, (new_cost + heuristic(new_board), new_board, new_cost, path + [(x, y, dx, dy)]))
+        for new_board, new_key, move in keyed_successors(current_board, symmetry):
+            if new_key not in visited:
+                visited[new_key] = None
+                if pagoda and not can_reach_center(new_board):
+                    continue
+                new_cost = current_cost + 1
+                heapq.heappush(pq, (new_cost + heuristic(new_board), new_key, next(counter), new_board, new_cost, (move, link)))
+        if max_nodes is not None:
+            if len(pq) > max_nodes:
+                trim_frontier(pq, visited, max_nodes)
+            if len(visited) > max_nodes:
+                trim_visited(visited, max_nodes)
 
     return None, None, nodes_expanded
 
+MAX_NODES = 20000  # Memory budget of the capped search in compare_algorithms
+
 # Board initialization
 def initialize_board():
     board = [[-1, -1,  1,  1,  1, -1, -1],
@@ -151,7 +167,19 @@ def compare_algorithms():
         print(f"Solution found with A* (Combined Heuristic) with path cost {cost}. Path: {path}")
     else:
         print("No solution found with A* (Combined Heuristic).")
+    print(f"Time Taken: {time_taken:.6f} seconds\n")
+
+    # A* Search holding at most MAX_NODES boards in the frontier and in the visited table
+    start_time = time.time()
+    print(f"Solving with memory-capped A* (Combined Heuristic, at most {MAX_NODES} boards)")
+    path, cost, nodes_expanded = a_star_search(board, combined_heuristic, max_nodes=MAX_NODES)
+    time_taken = time.time() - start_time
+    if path is not None:
+        print(f"Solution found with memory-capped A* with path cost {cost}. Path: {path}")
+    else:
+        print("No solution found with memory-capped A*.")
     print(f"Time Taken: {time_taken:.6f} seconds")
 
 # Run the comparison
-compare_algorithms()
+if __name__ == "__main__":
+    compare_algorithms()
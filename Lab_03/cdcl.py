@@ -0,0 +1,319 @@
+import heapq
+import random
+
+RESTART_UNIT = 100  # Conflicts in one unit of the Luby restart sequence
+ACTIVITY_DECAY = 0.95
+FIRST_REDUCE = 2000  # Conflicts before learned clauses are first cut down
+REDUCE_INCREMENT = 300
+
+def luby(i):
+    """i-th term (from 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..."""
+    while True:
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if (1 << k) - 1 == i:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+def encode(literal):
+    """DIMACS literal to an index: v is 2v and -v is 2v + 1, so negation is lit ^ 1."""
+    return 2 * literal if literal > 0 else -2 * literal + 1
+
+
+class CDCLSolver:
+    """Conflict-driven clause learning over the clauses of generate_3sat_problem.
+
+    Propagation uses two watched literals per clause, conflicts are analysed to the
+    first unique implication point, branching follows VSIDS activity with saved
+    phases, and the search restarts on the Luby sequence. Learned clauses with a high
+    LBD (number of distinct decision levels) are periodically deleted.
+    """
+
+    def __init__(self, clauses, n, seed=None):
+        self.n = n
+        self.value = [0] * (2 * n + 2)  # Per literal: 1 true, -1 false, 0 unassigned
+        self.level = [0] * (n + 1)
+        self.reason = [None] * (n + 1)  # Index of the clause that implied the variable
+        self.trail = []
+        self.trail_lim = []  # Trail length at the start of each decision level
+        self.qhead = 0
+        self.clauses = []  # Literal lists, watched literals first; None once deleted
+        self.watches = [[] for _ in range(2 * n + 2)]
+        self.learned = []
+        self.lbd = {}
+        self.conflicts = 0
+
+        rng = random.Random(seed)
+        self.activity = [0.0] + [rng.random() * 1e-5 for _ in range(n)]  # Random tie-breaking
+        self.increment = 1.0
+        self.phase = [False] * (n + 1)
+        self.seen = [False] * (n + 1)
+        self.heap = [(-self.activity[var], var) for var in range(1, n + 1)]
+        heapq.heapify(self.heap)
+
+        self.ok = True
+        for clause in clauses:
+            literals = sorted({encode(literal) for literal in clause})
+            if any(literal ^ 1 in literals for literal in literals):
+                continue  # Always satisfied
+            if any(self.value[literal] == 1 for literal in literals):
+                continue
+            literals = [literal for literal in literals if self.value[literal] == 0]
+            if not literals:
+                self.ok = False
+                break
+            if len(literals) == 1:
+                self.enqueue(literals[0], None)
+            else:
+                self.attach(literals)
+        if self.ok and self.propagate() is not None:
+            self.ok = False
+
+    def attach(self, literals):
+        index = len(self.clauses)
+        self.clauses.append(literals)
+        self.watches[literals[0]].append(index)
+        self.watches[literals[1]].append(index)
+        return index
+
+    def enqueue(self, literal, reason):
+        self.value[literal] = 1
+        self.value[literal ^ 1] = -1
+        var = literal >> 1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(literal)
+
+    def propagate(self):
+        """Unit propagation over the trail; returns the index of a conflicting clause or None."""
+        value = self.value
+        clauses = self.clauses
+        watches = self.watches
+        trail = self.trail
+        level = self.level
+        reason = self.reason
+        current_level = len(self.trail_lim)
+        while self.qhead < len(trail):
+            false_literal = trail[self.qhead] ^ 1
+            self.qhead += 1
+            watchers = watches[false_literal]
+            i = j = 0
+            end = len(watchers)
+            while i < end:
+                index = watchers[i]
+                i += 1
+                clause = clauses[index]
+                if clause is None:
+                    continue  # Deleted clause, dropped from the list here
+                # Keep the falsified watch in position 1
+                if clause[0] == false_literal:
+                    clause[0] = clause[1]
+                    clause[1] = false_literal
+                first = clause[0]
+                if value[first] == 1:
+                    watchers[j] = index
+                    j += 1
+                    continue
+                for k in range(2, len(clause)):
+                    literal = clause[k]
+                    if value[literal] != -1:
+                        clause[1] = literal
+                        clause[k] = false_literal
+                        watches[literal].append(index)
+                        break
+                else:
+                    watchers[j] = index
+                    j += 1
+                    if value[first] == -1:
+                        watchers[j:] = watchers[i:end]
+                        self.qhead = len(trail)
+                        return index
+                    # Same as enqueue, inlined for speed
+                    value[first] = 1
+                    value[first ^ 1] = -1
+                    level[first >> 1] = current_level
+                    reason[first >> 1] = index
+                    trail.append(first)
+            del watchers[j:]
+        return None
+
+    def bump(self, var):
+        self.activity[var] += self.increment
+        if self.activity[var] > 1e100:
+            self.activity = [activity * 1e-100 for activity in self.activity]
+            self.increment *= 1e-100
+            self.rebuild_heap()
+
+    def rebuild_heap(self):
+        value = self.value
+        self.heap = [(-self.activity[var], var) for var in range(1, self.n + 1) if value[2 * var] == 0]
+        heapq.heapify(self.heap)
+
+    def analyze(self, conflict):
+        """First-UIP learned clause for a conflict; returns (clause, backtrack level).
+
+        The asserting literal is first in the clause and the literal from the
+        backtrack level second, so both can be watched right away.
+        """
+        seen = self.seen
+        level = self.level
+        trail = self.trail
+        current_level = len(self.trail_lim)
+        learned = [None]
+        pending = 0
+        index = len(trail) - 1
+        clause = self.clauses[conflict]
+        start = 0
+        while True:
+            for literal in clause[start:]:
+                var = literal >> 1
+                if not seen[var] and level[var] > 0:
+                    seen[var] = True
+                    self.bump(var)
+                    if level[var] == current_level:
+                        pending += 1
+                    else:
+                        learned.append(literal)
+            # The most recent marked literal on the trail is resolved on next
+            while not seen[trail[index] >> 1]:
+                index -= 1
+            literal = trail[index]
+            index -= 1
+            var = literal >> 1
+            seen[var] = False
+            pending -= 1
+            if pending == 0:
+                break
+            clause = self.clauses[self.reason[var]]
+            start = 1  # Position 0 holds the implied literal itself
+        learned[0] = literal ^ 1
+
+        # Drop literals implied by other literals of the clause
+        levels = {level[literal >> 1] for literal in learned[1:]}
+        marked = [literal >> 1 for literal in learned[1:]]
+        minimized = [learned[0]]
+        for literal in learned[1:]:
+            if self.reason[literal >> 1] is None or not self.redundant(literal, levels, marked):
+                minimized.append(literal)
+        for var in marked:
+            seen[var] = False
+
+        if len(minimized) == 1:
+            return minimized, 0
+        highest = max(range(1, len(minimized)), key=lambda k: level[minimized[k] >> 1])
+        minimized[1], minimized[highest] = minimized[highest], minimized[1]
+        return minimized, level[minimized[1] >> 1]
+
+    def redundant(self, literal, levels, marked):
+        """Whether literal of a learned clause follows from the clause's other literals.
+
+        Walks reason clauses back through the implication graph; it fails on a decision
+        or on a level that has no literal in the clause. Variables shown to be implied
+        stay marked as seen (and are added to marked) so later checks can stop at them.
+        """
+        seen = self.seen
+        level = self.level
+        reason = self.reason
+        stack = [literal]
+        start = len(marked)
+        while stack:
+            for other in self.clauses[reason[stack.pop() >> 1]][1:]:
+                var = other >> 1
+                if seen[var] or level[var] == 0:
+                    continue
+                if reason[var] is None or level[var] not in levels:
+                    for undo in marked[start:]:
+                        seen[undo] = False
+                    del marked[start:]
+                    return False
+                seen[var] = True
+                marked.append(var)
+                stack.append(other)
+        return True
+
+    def backtrack(self, target_level):
+        if len(self.trail_lim) <= target_level:
+            return
+        start = self.trail_lim[target_level]
+        for literal in self.trail[start:]:
+            var = literal >> 1
+            self.value[literal] = self.value[literal ^ 1] = 0
+            self.reason[var] = None
+            self.phase[var] = not literal & 1
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[target_level:]
+        self.qhead = start
+
+    def pick_branch(self):
+        """Unassigned variable with the highest activity, or None when all are assigned."""
+        while self.heap:
+            key, var = heapq.heappop(self.heap)
+            if self.value[2 * var] == 0 and -key == self.activity[var]:
+                return var
+        return None
+
+    def reduce_learned(self):
+        """Delete the worse half of the learned clauses, keeping LBD <= 2 and reasons."""
+        locked = set(reason for reason in self.reason if reason is not None)
+        self.learned.sort(key=lambda index: self.lbd[index])
+        keep = len(self.learned) // 2
+        kept = self.learned[:keep]
+        for index in self.learned[keep:]:
+            if self.lbd[index] <= 2 or index in locked:
+                kept.append(index)
+            else:
+                self.clauses[index] = None
+                del self.lbd[index]
+        self.learned = kept
+
+    def solve(self):
+        """Returns a satisfying list of booleans, or None when the formula is unsatisfiable."""
+        if not self.ok:
+            return None
+        restarts = 0
+        restart_at = self.conflicts + RESTART_UNIT * luby(1)
+        reduce_at = self.conflicts + FIRST_REDUCE
+        reductions = 0
+        while True:
+            conflict = self.propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return None
+                learned, back_level = self.analyze(conflict)
+                self.backtrack(back_level)
+                if len(learned) == 1:
+                    self.enqueue(learned[0], None)
+                else:
+                    index = self.attach(learned)
+                    self.learned.append(index)
+                    self.lbd[index] = len({self.level[literal >> 1] for literal in learned})
+                    self.enqueue(learned[0], index)
+                self.increment /= ACTIVITY_DECAY
+                continue
+
+            if self.conflicts >= restart_at:
+                restarts += 1
+                restart_at = self.conflicts + RESTART_UNIT * luby(restarts + 1)
+                self.backtrack(0)
+                self.rebuild_heap()  # Also clears out stale heap entries
+            if self.conflicts >= reduce_at:
+                reductions += 1
+                reduce_at = self.conflicts + FIRST_REDUCE + REDUCE_INCREMENT * reductions
+                self.reduce_learned()
+
+            var = self.pick_branch()
+            if var is None:
+                return [self.value[2 * var] == 1 for var in range(1, self.n + 1)]
+            self.trail_lim.append(len(self.trail))
+            self.enqueue(2 * var if self.phase[var] else 2 * var + 1, None)
+
+def cdcl(clauses, n, seed=None):
+    """Complete solver: returns (solution, conflicts), where solution is None only when
+    the clauses are unsatisfiable."""
+    solver = CDCLSolver(clauses, n, seed)
+    solution = solver.solve()
+    return solution, solver.conflicts
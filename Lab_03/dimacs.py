@@ -0,0 +1,182 @@
+import argparse
+import bz2
+import gzip
+import lzma
+import random
+from array import array
+
+import numpy as np
+
+# Benchmark sets are often shipped compressed
+OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+READ_SIZE = 1 << 20
+WRITE_BATCH = 10000  # Clause lines joined per write
+
+
+class CNF:
+    """Clauses stored flat as in DIMACS: the literals of each clause followed by a 0.
+
+    Four bytes per literal instead of a Python set per clause. Iterating yields each
+    clause as a tuple, so a CNF can be passed anywhere a list of clauses is expected.
+    """
+
+    def __init__(self, n=0):
+        self.n = n
+        self.literals = array('i')
+        self.num_clauses = 0
+
+    @classmethod
+    def from_clauses(cls, clauses, n=0):
+        cnf = cls(n)
+        for clause in clauses:
+            cnf.add_clause(clause)
+        return cnf
+
+    @classmethod
+    def from_array(cls, clauses, n):
+        """CNF from an (m, k) integer array of literals, one clause per row."""
+        clauses = np.asarray(clauses, dtype=np.intc)
+        cnf = cls(n)
+        terminated = np.zeros((len(clauses), clauses.shape[1] + 1), dtype=np.intc)
+        terminated[:, :-1] = clauses
+        cnf.literals.frombytes(terminated.tobytes())
+        cnf.num_clauses = len(clauses)
+        return cnf
+
+    def add_clause(self, clause):
+        start = len(self.literals)
+        self.literals.extend(clause)
+        if start < len(self.literals):
+            self.n = max(self.n, max(map(abs, self.literals[start:])))
+        self.literals.append(0)
+        self.num_clauses += 1
+
+    def __len__(self):
+        return self.num_clauses
+
+    def __iter__(self):
+        clause = []
+        for literal in self.literals:
+            if literal:
+                clause.append(literal)
+            else:
+                yield tuple(clause)
+                clause = []
+
+def open_cnf(path, mode):
+    for suffix, opener in OPENERS.items():
+        if path.endswith(suffix):
+            return opener(path, mode + 't', encoding='ascii')
+    return open(path, mode, encoding='ascii')
+
+def read_dimacs(path):
+    """Read a DIMACS CNF file (optionally .gz, .bz2 or .xz) into a CNF.
+
+    The file is read in blocks of READ_SIZE characters, and the literals of each
+    block are parsed by NumPy in one call.
+    """
+    cnf = CNF()
+    declared_clauses = None
+    literals = cnf.literals
+    with open_cnf(path, 'r') as f:
+        # Comments and the problem line come first
+        for line in f:
+            if line.startswith('c') or not line.strip():
+                continue
+            if not line.startswith('p'):
+                break
+            _, fmt, n, m = line.split()
+            if fmt != 'cnf':
+                raise ValueError(f"{path}: not a CNF file ({fmt})")
+            cnf.n = int(n)
+            declared_clauses = int(m)
+        else:
+            line = ''
+
+        rest = line
+        while True:
+            block = f.read(READ_SIZE)
+            text = rest + block
+            if block:
+                # Keep a partial last line for the next block
+                cut = text.rfind('\n') + 1
+                text, rest = text[:cut], text[cut:]
+            if 'c' in text or '%' in text:
+                end = parse_lines(text, literals)
+            else:
+                literals.frombytes(np.fromstring(text, dtype=np.intc, sep=' ').tobytes())
+                end = False
+            if end or not block:
+                break
+    if literals and literals[-1] != 0:
+        literals.append(0)  # Last clause without its terminator
+    values = np.frombuffer(literals, dtype=np.intc)
+    cnf.num_clauses = int(np.count_nonzero(values == 0))  # A clause may span several lines
+    if len(values):
+        cnf.n = max(cnf.n, int(np.abs(values).max()))
+    del values  # Release the buffer so the array can grow again
+    if declared_clauses is not None and declared_clauses != cnf.num_clauses:
+        raise ValueError(f"{path}: header declares {declared_clauses} clauses, found {cnf.num_clauses}")
+    return cnf
+
+def parse_lines(text, literals):
+    """Slow path for blocks holding comments; returns True at SATLIB's closing "%"."""
+    for line in text.splitlines():
+        line = line.strip()
+        if line.startswith('%'):
+            return True  # SATLIB files end with "%" and a stray 0
+        if line and not line.startswith('c'):
+            literals.extend(map(int, line.split()))
+    return False
+
+def write_dimacs(path, clauses, n, m=None, comments=()):
+    """Write clauses to a DIMACS CNF file as they are produced.
+
+    clauses may be any iterable, e.g. a generator; m is then required since the
+    header comes first, and a ValueError is raised if the count does not match.
+    """
+    if m is None:
+        m = len(clauses)
+    written = 0
+    with open_cnf(path, 'w') as f:
+        for comment in comments:
+            f.write(f"c {comment}\n")
+        f.write(f"p cnf {n} {m}\n")
+        lines = []
+        for clause in clauses:
+            lines.append(' '.join(map(str, clause)) + ' 0\n')
+            if len(lines) == WRITE_BATCH:
+                f.writelines(lines)
+                written += len(lines)
+                lines = []
+        f.writelines(lines)
+        written += len(lines)
+    if written != m:
+        raise ValueError(f"expected {m} clauses, got {written}")
+
+def random_clauses(k, m, n, rng=random):
+    """m random k-clauses over n variables, with k distinct variables per clause as in
+    k-SAT.py, generated one at a time."""
+    for _ in range(m):
+        clause = []
+        while len(clause) < k:
+            variable = rng.randint(1, n)
+            if variable not in clause and -variable not in clause:
+                clause.append(variable if rng.random() < 0.5 else -variable)
+        yield clause
+
+def write_random_ksat(path, k, m, n, seed=None):
+    """Write a random k-SAT instance to path without holding it in memory."""
+    rng = random.Random(seed)
+    write_dimacs(path, random_clauses(k, m, n, rng), n, m,
+                 comments=[f"random {k}-SAT, n={n}, m={m}, seed={seed}"])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a random k-SAT instance in DIMACS CNF format.")
+    parser.add_argument("path", help="output file, compressed if it ends in .gz, .bz2 or .xz")
+    parser.add_argument("-k", type=int, default=3, help="literals per clause")
+    parser.add_argument("-m", type=int, required=True, help="number of clauses")
+    parser.add_argument("-n", type=int, required=True, help="number of variables")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    write_random_ksat(args.path, args.k, args.m, args.n, args.seed)
@@ -1,5 +1,7 @@
 import random
 
+from ksat_generator import generate_clauses
+
 def generate_k_sat_problem(k, m, n):
     choices = []
     for i in range(n):
@@ -23,15 +25,23 @@ def generate_k_sat_problem(k, m, n):
 
     print(ans)
 
+def print_problem(clauses):
+    # Letters run out after 26 variables, so these are named x1, x2, ...
+    print(" ∧ ".join("(" + " ∨ ".join(f"x{literal}" if literal > 0 else f"-x{-literal}" for literal in clause) + ")"
+                     for clause in clauses.tolist()))
+
 def main():
     k = int(input("Enter the length of clause k: "))
     m = int(input("Enter the number of clauses m: "))
-    n = int(input("Enter the number of variables n (max 26): "))
+    n = int(input("Enter the number of variables n: "))
     p = int(input("Enter the number of problems to be generated: "))
     
     for i in range(p):
         print(f"\nProblem {i + 1}:")
-        generate_k_sat_problem(k, m, n)
+        if n <= 26:
+            generate_k_sat_problem(k, m, n)
+        else:
+            print_problem(generate_clauses(k, m, n))
         
 if __name__== "__main__":
     # Your code here
@@ -0,0 +1,76 @@
+import argparse
+from multiprocessing import Pool
+
+import numpy as np
+
+from dimacs import CNF, write_dimacs
+
+DENSE_CHUNK = 1 << 22  # Random keys drawn at a time when sampling by argpartition
+
+def distinct_variables(rng, m, k, n):
+    """(m, k) array of variables 1..n with no variable repeated inside a row."""
+    if k * k <= n:
+        # Repeats are rare: draw every row at once, then redraw only the rows with one
+        variables = rng.integers(1, n + 1, size=(m, k), dtype=np.int32)
+        redraw = np.arange(m)
+        while len(redraw):
+            rows = np.sort(variables[redraw], axis=1)
+            redraw = redraw[(rows[:, 1:] == rows[:, :-1]).any(axis=1)]
+            variables[redraw] = rng.integers(1, n + 1, size=(len(redraw), k), dtype=np.int32)
+        return variables
+
+    # k close to n would need many redraws: take the k smallest of n random keys per row
+    variables = np.empty((m, k), dtype=np.int32)
+    rows = max(1, DENSE_CHUNK // n)
+    for start in range(0, m, rows):
+        keys = rng.random((min(rows, m - start), n))
+        variables[start:start + rows] = np.argpartition(keys, k - 1, axis=1)[:, :k] + 1
+    return variables
+
+def generate_clauses(k, m, n, seed=None):
+    """m random k-clauses over variables 1..n as an (m, k) int32 array of literals.
+
+    Each clause has k distinct variables, each negated with probability 1/2, the same
+    distribution as generate_k_sat_problem in k-SAT.py. seed may be an int or a
+    numpy SeedSequence.
+    """
+    if not 0 < k <= n:
+        raise ValueError("need 0 < k <= n")
+    rng = np.random.default_rng(seed)
+    literals = distinct_variables(rng, m, k, n)
+    literals[rng.random((m, k)) < 0.5] *= -1
+    return literals
+
+def generate_ksat(k, m, n, seed=None):
+    """Random k-SAT problem as a CNF, ready for the solvers."""
+    return CNF.from_array(generate_clauses(k, m, n, seed), n)
+
+def generate_from_seed(task):
+    k, m, n, seed = task
+    return generate_ksat(k, m, n, seed)
+
+def generate_many(k, m, n, count, seed=None, workers=None):
+    """count independent problems, generated in parallel.
+
+    Every problem gets its own child of one SeedSequence, so the result depends on
+    seed but not on the number of workers.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(count)
+    with Pool(workers) as pool:
+        return pool.map(generate_from_seed, [(k, m, n, child) for child in seeds])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate random k-SAT problems as DIMACS files.")
+    parser.add_argument("prefix", help="problems are written to <prefix><i>.cnf")
+    parser.add_argument("-k", type=int, default=3)
+    parser.add_argument("-m", type=int, required=True)
+    parser.add_argument("-n", type=int, required=True)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    for index, cnf in enumerate(generate_many(args.k, args.m, args.n, args.count, args.seed, args.workers), 1):
+        path = f"{args.prefix}{index}.cnf"
+        write_dimacs(path, cnf, cnf.n, len(cnf), comments=[f"random {args.k}-SAT, seed={args.seed}, problem {index}"])
+        print(f"Wrote {path}")
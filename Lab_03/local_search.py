@@ -0,0 +1,246 @@
+import itertools
+import random
+
+def normalize_clauses(clauses):
+    """Clauses as tuples of distinct literals.
+
+    Clauses holding both x and -x are always satisfied and are dropped; their count is
+    returned so satisfied-clause totals still match count_satisfied_clauses.
+    """
+    normalized = []
+    tautologies = 0
+    for clause in clauses:
+        literals = tuple(dict.fromkeys(clause))
+        if any(-literal in literals for literal in literals):
+            tautologies += 1
+        else:
+            normalized.append(literals)
+    return normalized, tautologies
+
+
+class ClauseState:
+    """An assignment together with the clause bookkeeping needed to flip in O(occurrences).
+
+    For every clause it keeps the number of true literals and the XOR of the variables of
+    its true literals (which names the true variable when there is exactly one). For
+    every variable it keeps
+      make[v]  - unsatisfied clauses that flipping v would satisfy
+      break[v] - satisfied clauses in which v is the only true literal
+    """
+
+    def __init__(self, clauses, n, assignment):
+        self.clauses, self.tautologies = normalize_clauses(clauses)
+        self.n = n
+        self.value = [False] + [bool(x) for x in assignment]  # 1-based, like the literals
+        # occurrences[literal + n] lists the clauses containing that literal
+        self.occurrences = [[] for _ in range(2 * n + 1)]
+        for index, clause in enumerate(self.clauses):
+            for literal in clause:
+                self.occurrences[literal + n].append(index)
+
+        self.true_count = [0] * len(self.clauses)
+        self.true_xor = [0] * len(self.clauses)
+        self.make = [0] * (n + 1)
+        self.break_count = [0] * (n + 1)
+        self.unsat = []
+        self.unsat_position = [-1] * len(self.clauses)
+        for index, clause in enumerate(self.clauses):
+            for literal in clause:
+                if self.is_true(literal):
+                    self.true_count[index] += 1
+                    self.true_xor[index] ^= abs(literal)
+            if self.true_count[index] == 0:
+                self._add_unsat(index)
+                for literal in clause:
+                    self.make[abs(literal)] += 1
+            elif self.true_count[index] == 1:
+                self.break_count[self.true_xor[index]] += 1
+
+    def is_true(self, literal):
+        return self.value[literal] if literal > 0 else not self.value[-literal]
+
+    def _add_unsat(self, index):
+        self.unsat_position[index] = len(self.unsat)
+        self.unsat.append(index)
+
+    def _remove_unsat(self, index):
+        position = self.unsat_position[index]
+        last = self.unsat.pop()
+        if last != index:
+            self.unsat[position] = last
+            self.unsat_position[last] = position
+        self.unsat_position[index] = -1
+
+    def satisfied_count(self):
+        return len(self.clauses) + self.tautologies - len(self.unsat)
+
+    def score(self, variable):
+        """Change in satisfied clauses if variable were flipped."""
+        return self.make[variable] - self.break_count[variable]
+
+    def flip(self, variable):
+        n = self.n
+        new_value = not self.value[variable]
+        became_true = variable if new_value else -variable
+        self.value[variable] = new_value
+
+        for index in self.occurrences[became_true + n]:
+            count = self.true_count[index] + 1
+            self.true_count[index] = count
+            self.true_xor[index] ^= variable
+            if count == 1:
+                self._remove_unsat(index)
+                for literal in self.clauses[index]:
+                    self.make[abs(literal)] -= 1
+                self.break_count[variable] += 1
+            elif count == 2:
+                # The variable that used to be the only true literal no longer breaks it
+                self.break_count[self.true_xor[index] ^ variable] -= 1
+
+        for index in self.occurrences[-became_true + n]:
+            count = self.true_count[index] - 1
+            self.true_count[index] = count
+            self.true_xor[index] ^= variable
+            if count == 0:
+                self._add_unsat(index)
+                for literal in self.clauses[index]:
+                    self.make[abs(literal)] += 1
+                self.break_count[variable] -= 1
+            elif count == 1:
+                self.break_count[self.true_xor[index]] += 1
+
+    def solution(self):
+        return self.value[1:]
+
+def random_assignment(n, rng):
+    return [rng.random() < 0.5 for _ in range(n)]
+
+def steepest_ascent(clauses, n, seed=None):
+    """Same search as hill_climbing in 3-SAT.py, with incremental scores.
+
+    Returns (solution, flips); solution is None when stuck in a local maximum.
+    """
+    rng = random.Random(seed)
+    state = ClauseState(clauses, n, random_assignment(n, rng))
+    flips = 0
+    while state.unsat:
+        best = max(range(1, n + 1), key=state.score)
+        if state.score(best) <= 0:
+            return None, flips
+        state.flip(best)
+        flips += 1
+    return state.solution(), flips
+
+def gsat(clauses, n, max_flips=100000, max_tries=10, seed=None):
+    """GSAT: repeatedly flip the variable with the best score, restarting after max_flips.
+
+    Every variable is a candidate, so on a plateau GSAT can make sideways (score 0)
+    moves anywhere instead of undoing its last flip; ties are broken at random.
+    Returns (solution, flips).
+    """
+    rng = random.Random(seed)
+    flips = 0
+    variables = range(1, n + 1)
+    for _ in range(max_tries):
+        state = ClauseState(clauses, n, random_assignment(n, rng))
+        for _ in range(max_flips):
+            if not state.unsat:
+                return state.solution(), flips
+            scores = list(map(state.score, variables))
+            best_score = max(scores)
+            best = [variable for variable, score in zip(variables, scores) if score == best_score]
+            state.flip(rng.choice(best))
+            flips += 1
+        if not state.unsat:
+            return state.solution(), flips
+    return None, flips
+
+def walksat(clauses, n, noise=0.5, max_flips=100000, max_tries=10, seed=None):
+    """WalkSAT: fix a random unsatisfied clause each step.
+
+    A variable that breaks nothing is flipped right away; otherwise, with probability
+    noise a random variable of the clause is flipped, else the one that breaks the
+    fewest clauses. Returns (solution, flips).
+    """
+    rng = random.Random(seed)
+    flips = 0
+    for _ in range(max_tries):
+        state = ClauseState(clauses, n, random_assignment(n, rng))
+        for _ in range(max_flips):
+            if not state.unsat:
+                return state.solution(), flips
+            clause = state.clauses[rng.choice(state.unsat)]
+            breaks = [state.break_count[abs(literal)] for literal in clause]
+            fewest = min(breaks)
+            if fewest > 0 and rng.random() < noise:
+                variable = abs(rng.choice(clause))
+            else:
+                variable = abs(rng.choice([literal for literal, count in zip(clause, breaks) if count == fewest]))
+            state.flip(variable)
+            flips += 1
+        if not state.unsat:
+            return state.solution(), flips
+    return None, flips
+
+def flip_moves(variables, k):
+    """Every set of k distinct variables, as index tuples generated one at a time."""
+    return itertools.combinations(variables, k)
+
+def move_delta(state, move):
+    """Change in satisfied clauses if every variable of move were flipped.
+
+    All but the last variable are flipped and reverted on the state, and the last one
+    is read from the make/break counts, so a k-flip move costs k - 1 flip pairs.
+    """
+    *head, last = move
+    before = len(state.unsat)
+    for variable in head:
+        state.flip(variable)
+    delta = before - len(state.unsat) + state.score(last)
+    for variable in reversed(head):
+        state.flip(variable)
+    return delta
+
+def best_move(state, variables, k, first_improvement=False):
+    """Best improving k-flip move as (move, delta, moves_scored); move is None if none improves.
+
+    With first_improvement the scan stops at the first improving move.
+    """
+    best, best_delta = None, 0
+    scored = 0
+    for move in flip_moves(variables, k):
+        scored += 1
+        delta = move_delta(state, move)
+        if delta > best_delta:
+            best, best_delta = move, delta
+            if first_improvement:
+                break
+    return best, best_delta, scored
+
+def variable_neighborhood_descent(clauses, n, max_k=3, first_improvement=False, seed=None):
+    """Descent over the 1-flip, 2-flip, ..., max_k-flip neighborhoods.
+
+    Takes an improving move from the smallest neighborhood that has one and goes back
+    to single flips after every move. Moves are generated lazily and scored against
+    the cached clause state, so memory stays O(n + m). Returns (solution, moves_scored);
+    solution is None at a local optimum of every neighborhood.
+    """
+    rng = random.Random(seed)
+    state = ClauseState(clauses, n, random_assignment(n, rng))
+    variables = list(range(1, n + 1))
+    scored = 0
+    k = 1
+    while state.unsat:
+        if first_improvement:
+            rng.shuffle(variables)  # Otherwise low-numbered variables would always win
+        move, _, count = best_move(state, variables, k, first_improvement)
+        scored += count
+        if move is None:
+            if k == max_k:
+                return None, scored
+            k += 1
+            continue
+        for variable in move:
+            state.flip(variable)
+        k = 1
+    return state.solution(), scored
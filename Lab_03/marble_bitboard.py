@@ -0,0 +1,225 @@
+# The English cross board as a 33-bit integer, one bit per hole
+from operator import xor
+
+# Directions for the movement in the game (up, down, left, right)
+MOVES = [(2, 0), (-2, 0), (0, 2), (0, -2)]
+
+# Holes of the cross in row-major order
+CELLS = [(x, y) for x in range(7) for y in range(7) if 2 <= x <= 4 or 2 <= y <= 4]
+NUM_CELLS = len(CELLS)
+# The first hole is the most significant bit, so comparing two boards as integers
+# orders them the same way as comparing the 7x7 grids row by row
+BIT = {cell: 1 << (NUM_CELLS - 1 - index) for index, cell in enumerate(CELLS)}
+CENTER = BIT[(3, 3)]
+FULL = (1 << NUM_CELLS) - 1
+
+def byte_tables(weights, width=8):
+    """Split the board into bytes; for each byte, the summed weight of every value it can take.
+
+    weights maps a cell to its weight. A weighted sum over the marbles then costs one
+    lookup per byte instead of a pass over all 33 holes. With width the board is split
+    into chunks of that many bits instead.
+    """
+    by_bit = {bit.bit_length() - 1: weights[cell] for cell, bit in BIT.items()}
+    tables = []
+    for shift in range(0, NUM_CELLS, width):
+        tables.append([sum(by_bit.get(shift + b, 0) for b in range(width) if value >> b & 1)
+                       for value in range(1 << width)])
+    return tables
+
+def symmetries():
+    """The 8 symmetries of the cross (rotations and reflections about the center) as
+    cell -> cell maps, the identity first."""
+    permutations = []
+    for reflect in (False, True):
+        for turns in range(4):
+            permutation = {}
+            for x, y in CELLS:
+                i, j = x - 3, y - 3
+                if reflect:
+                    j = -j
+                for _ in range(turns):
+                    i, j = j, -i
+                permutation[(x, y)] = (i + 3, j + 3)
+            permutations.append(permutation)
+    return permutations
+
+# Image of a board under each non-identity symmetry, 11 bits at a time (three lookups
+# instead of five): the images of the holes are distinct bits, so summing them is the
+# same as OR-ing them
+SYMMETRY_TABLES = [byte_tables({cell: BIT[image] for cell, image in permutation.items()}, width=11)
+                   for permutation in symmetries()[1:]]
+
+def board_images(board):
+    """The 8 symmetric images of board, the board itself first."""
+    images = [board]
+    low, middle, high = board & 2047, board >> 11 & 2047, board >> 22
+    for t0, t1, t2 in SYMMETRY_TABLES:
+        images.append(t0[low] | t1[middle] | t2[high])
+    return images
+
+def canonical_board(board):
+    """One representative of board's symmetry class: the smallest of its 8 images."""
+    return min(board_images(board))
+
+def build_jumps():
+    """Every jump on the board as (marbles it needs, hole it needs, move), in the order
+    the grid search visited them: by hole, then by direction."""
+    jumps = []
+    for x, y in CELLS:
+        for dx, dy in MOVES:
+            over = (x + dx // 2, y + dy // 2)
+            target = (x + dx, y + dy)
+            if over in BIT and target in BIT:
+                jumps.append((BIT[(x, y)] | BIT[over], BIT[target], (x, y, dx, dy)))
+    return jumps
+
+def build_jump_groups(jumps):
+    """Group the jumps whose jumped-over and target holes sit at the same bit offsets
+    from their source, so a whole group is tested for all its sources at once.
+
+    A group is (over_shift, target_shift, sources, by_source): shifting the board by
+    over_shift lines every jumped-over bit up with its source bit, likewise for the
+    targets, and by_source maps a source bit to (bits the jump flips, move, the 8
+    images of those bits). Groups are split by the direction of the shift.
+    """
+    groups = {}
+    for marbles, hole, move in jumps:
+        x, y, dx, dy = move
+        source = BIT[(x, y)]
+        over = marbles ^ source
+        key = (source.bit_length() - over.bit_length(), source.bit_length() - hole.bit_length())
+        group = groups.setdefault(key, [0, {}])
+        group[0] |= source
+        group[1][source] = (marbles | hole, move, board_images(marbles | hole))
+    left = [(over, target, sources, by_source) for (over, target), (sources, by_source) in groups.items() if over > 0]
+    right = [(-over, -target, sources, by_source) for (over, target), (sources, by_source) in groups.items() if over < 0]
+    return left, right
+
+JUMPS = build_jumps()
+LEFT_JUMPS, RIGHT_JUMPS = build_jump_groups(JUMPS)
+
+def legal_jumps(board):
+    """(flip, move, flip_images) for every jump that can be made on board."""
+    result = []
+    # Sources holding a marble, with a marble to jump over and an empty target
+    for over, target, sources, by_source in LEFT_JUMPS:
+        found = board & (board << over) & ~(board << target) & sources
+        while found:
+            source = found & -found
+            found ^= source
+            result.append(by_source[source])
+    for over, target, sources, by_source in RIGHT_JUMPS:
+        found = board & (board >> over) & ~(board >> target) & sources
+        while found:
+            source = found & -found
+            found ^= source
+            result.append(by_source[source])
+    return result
+
+def successors(board):
+    """(new_board, move) for every legal jump; a jump flips its three bits."""
+    return [(board ^ flip, move) for flip, move, _ in legal_jumps(board)]
+
+def keyed_successors(board, symmetry=True):
+    """(new_board, key, move) for every legal jump, where key is what the search
+    remembers the board by: canonical_board(new_board) with symmetry, else new_board.
+
+    A symmetry maps board ^ flip to image(board) ^ image(flip), so the images of board
+    are computed once and each successor's key costs 8 XORs.
+    """
+    if not symmetry:
+        return [(board ^ flip, board ^ flip, move) for flip, move, _ in legal_jumps(board)]
+    images = board_images(board)
+    return [(board ^ flip, min(map(xor, images, flip_images)), move)
+            for flip, move, flip_images in legal_jumps(board)]
+
+def board_from_grid(grid):
+    """Bitboard of a 7x7 grid as built by initialize_board (1 marble, 0 hole, -1 off board)."""
+    return sum(bit for (x, y), bit in BIT.items() if grid[x][y] == 1)
+
+def grid_from_board(board):
+    grid = [[-1] * 7 for _ in range(7)]
+    for (x, y), bit in BIT.items():
+        grid[x][y] = 1 if board & bit else 0
+    return grid
+
+def count_marbles(board):
+    return board.bit_count()  # popcount
+
+def weighted_sum(board, tables):
+    """Summed weight of the holes holding a marble, for tables from byte_tables."""
+    t0, t1, t2, t3, t4 = tables
+    return (t0[board & 255] + t1[board >> 8 & 255] + t2[board >> 16 & 255]
+            + t3[board >> 24 & 255] + t4[board >> 32])
+
+MANHATTAN = byte_tables({(x, y): abs(3 - x) + abs(3 - y) for x, y in CELLS})
+
+def manhattan_distance(board):
+    """Total Manhattan distance of the marbles to the center."""
+    return weighted_sum(board, MANHATTAN)
+
+# Pagoda functions: weights on the holes such that no jump can raise the summed
+# weight of the marbles (a marble's weight plus the one it jumps over is never less
+# than the weight of its target). A board whose sum is already below that of the goal,
+# one marble in the center, can never be solved. None is off the board.
+_ = None
+PAGODA_GRIDS = [
+    [[ _,  _, -1,  0, -1,  _,  _],
+     [ _,  _,  1,  1,  1,  _,  _],
+     [-1,  1,  0,  1,  0,  1, -1],
+     [ 0,  1,  1,  1,  1,  1,  0],
+     [-1,  1,  0,  1,  0,  1, -1],
+     [ _,  _,  1,  1,  1,  _,  _],
+     [ _,  _, -1,  0, -1,  _,  _]],
+    [[ _,  _,  0,  0,  0,  _,  _],
+     [ _,  _,  0,  1,  0,  _,  _],
+     [ 0,  0,  0,  0,  0,  0,  0],
+     [ 0,  1,  0,  1,  0,  1,  0],
+     [ 0,  0,  0,  0,  0,  0,  0],
+     [ _,  _,  0,  1,  0,  _,  _],
+     [ _,  _,  0,  0,  0,  _,  _]],
+    [[ _,  _,  0,  0,  0,  _,  _],
+     [ _,  _,  0,  1,  0,  _,  _],
+     [-1,  1,  0,  1,  0,  1, -1],
+     [ 0,  1,  0,  1,  0,  1,  0],
+     [-1,  1,  0,  1,  0,  1, -1],
+     [ _,  _,  0,  1,  0,  _,  _],
+     [ _,  _,  0,  0,  0,  _,  _]],
+]
+del _
+
+def is_pagoda(weights):
+    """Whether the cell -> weight map weights can only stay level or drop with each jump."""
+    for _, _, (x, y, dx, dy) in JUMPS:
+        if weights[(x, y)] + weights[(x + dx // 2, y + dy // 2)] < weights[(x + dx, y + dy)]:
+            return False
+    return True
+
+def build_pagodas(grids):
+    """(tables, goal value) for each pagoda grid and each of its symmetric images.
+
+    The goal is symmetric, so an image of a pagoda function is one as well; every
+    function is checked against all the jumps before it is used for pruning.
+    """
+    pagodas = []
+    seen = set()
+    for grid in grids:
+        for permutation in symmetries():
+            weights = {permutation[(x, y)]: grid[x][y] for x, y in CELLS}
+            if not is_pagoda(weights):
+                raise ValueError(f"not a pagoda function: {grid}")
+            signature = tuple(weights[cell] for cell in CELLS)
+            if signature not in seen:
+                seen.add(signature)
+                pagodas.append((byte_tables(weights), weights[(3, 3)]))
+    return pagodas
+
+PAGODAS = build_pagodas(PAGODA_GRIDS)
+
+def can_reach_center(board):
+    """False when some pagoda function proves board cannot be reduced to CENTER."""
+    for tables, goal in PAGODAS:
+        if weighted_sum(board, tables) < goal:
+            return False
+    return True
@@ -0,0 +1,161 @@
+import argparse
+import functools
+import importlib.util
+import multiprocessing
+import os
+import queue
+import random
+import time
+
+from cdcl import cdcl
+from dimacs import read_dimacs
+from local_search import gsat, walksat
+
+THREE_SAT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "3-SAT.py")
+SOLVERS = ["walksat", "gsat", "cdcl", "hill_climbing", "beam_search", "vnd"]  # Names solve_once knows
+POLL_INTERVAL = 0.1  # Seconds between checks that some worker is still running
+
+@functools.lru_cache(maxsize=None)
+def load_three_sat():
+    """Import 3-SAT.py, whose name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("three_sat", THREE_SAT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def satisfies(solution, clauses):
+    return all(any(solution[abs(literal) - 1] == (literal > 0) for literal in clause) for clause in clauses)
+
+def solve_once(name, clauses, n, seed, options):
+    """One run of a solver; None means it gave up (or, for cdcl, that there is no solution)."""
+    if name == "walksat":
+        return walksat(clauses, n, seed=seed, max_tries=1, **options)[0]
+    if name == "gsat":
+        return gsat(clauses, n, seed=seed, max_tries=1, **options)[0]
+    if name == "cdcl":
+        return cdcl(clauses, n, seed=seed)[0]
+
+    # The solvers in 3-SAT.py draw from the global random module
+    three_sat = load_three_sat()
+    random.seed(seed)
+    if name == "hill_climbing":
+        return three_sat.hill_climbing(clauses, n)
+    if name == "beam_search":
+        return three_sat.beam_search(clauses, n, **options)
+    if name == "vnd":
+        return three_sat.variable_neighborhood_descent(clauses, n)
+    raise ValueError(f"unknown solver {name}")
+
+def run_configuration(label, name, seed, options, clauses, n, results):
+    """Worker process: restart the solver with fresh seeds until it returns an answer."""
+    rng = random.Random(seed)
+    runs = 0
+    while True:
+        runs += 1
+        solution = solve_once(name, clauses, n, rng.randrange(2 ** 32), options)
+        if solution is not None or name == "cdcl":
+            results.put((label, solution, runs))
+            return
+
+def default_configurations(workers):
+    """One CDCL run next to WalkSAT runs with differing noise and seeds."""
+    configurations = [("cdcl", 0, {})]
+    noises = [0.5, 0.4, 0.57, 0.3]
+    for index in range(1, workers):
+        configurations.append(("walksat", index, {"noise": noises[index % len(noises)]}))
+    return configurations
+
+def run_portfolio(clauses, n, configurations=None, budget=60.0):
+    """Race solver configurations, one process each, on the same instance.
+
+    configurations are (solver name, seed, options) triples. The first assignment that
+    checks out against the clauses wins and every other worker is terminated at once,
+    as is everything when the wall-clock budget runs out. If every worker exits
+    without an answer (e.g. by crashing) the wait ends early. Returns a dict with
+    status "SAT", "UNSAT" (only cdcl can prove that) or "TIMEOUT".
+    """
+    if configurations is None:
+        configurations = default_configurations(os.cpu_count() or 1)
+    results = multiprocessing.Queue()
+    processes = []
+    for name, seed, options in configurations:
+        label = f"{name}(seed={seed}" + "".join(f", {key}={value}" for key, value in options.items()) + ")"
+        process = multiprocessing.Process(target=run_configuration,
+                                          args=(label, name, seed, options, clauses, n, results), daemon=True)
+        processes.append(process)
+
+    start_time = time.perf_counter()
+    deadline = time.monotonic() + budget
+    outcome = {"status": "TIMEOUT", "solver": None, "solution": None, "runs": 0}
+    try:
+        for process in processes:
+            process.start()
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                label, solution, runs = results.get(timeout=min(remaining, POLL_INTERVAL))
+            except queue.Empty:
+                if any(process.is_alive() for process in processes):
+                    continue
+                try:  # A last answer may have been queued just before its worker exited
+                    label, solution, runs = results.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    break
+            if solution is None:
+                outcome = {"status": "UNSAT", "solver": label, "solution": None, "runs": runs}
+                break
+            if satisfies(solution, clauses):
+                outcome = {"status": "SAT", "solver": label, "solution": solution, "runs": runs}
+                break
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join()
+    outcome["time"] = time.perf_counter() - start_time
+    return outcome
+
+def parse_configuration(text):
+    """"walksat:3:noise=0.4" -> ("walksat", 3, {"noise": 0.4})"""
+    name, _, rest = text.partition(":")
+    if name not in SOLVERS:
+        raise argparse.ArgumentTypeError(f"unknown solver {name!r} (choose from {', '.join(SOLVERS)})")
+    seed, _, rest = rest.partition(":")
+    options = {}
+    for option in filter(None, rest.split(",")):
+        key, _, value = option.partition("=")
+        options[key] = int(value) if value.isdigit() else float(value)
+    return name, int(seed or 0), options
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Race several SAT solver configurations on one instance.")
+    parser.add_argument("cnf", nargs="?", help="DIMACS file; a random 3-SAT problem is generated otherwise")
+    parser.add_argument("-n", type=int, default=200, help="variables of the generated problem")
+    parser.add_argument("-m", type=int, default=850, help="clauses of the generated problem")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the generated problem")
+    parser.add_argument("--budget", type=float, default=60.0, help="wall-clock seconds")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--config", action="append", type=parse_configuration,
+                        help="solver:seed[:key=value,...], e.g. walksat:1:noise=0.4 (repeatable)")
+    args = parser.parse_args()
+
+    if args.cnf:
+        clauses = read_dimacs(args.cnf)
+        n = clauses.n
+    else:
+        random.seed(args.seed)
+        clauses = load_three_sat().generate_3sat_problem(args.n, args.m)
+        n = args.n
+    configurations = args.config or default_configurations(args.workers)
+
+    outcome = run_portfolio(clauses, n, configurations, args.budget)
+    if outcome["status"] == "TIMEOUT":
+        print(f"No answer after {outcome['time']:.2f} s (budget {args.budget:.1f} s)")
+    elif outcome["status"] == "UNSAT":
+        print(f"Unsatisfiable, proved by {outcome['solver']} in {outcome['time']:.2f} s")
+    else:
+        print(f"Satisfied by {outcome['solver']} after {outcome['runs']} runs in {outcome['time']:.2f} s")
+        print("Solution:", [int(x) for x in outcome["solution"]])
@@ -0,0 +1,205 @@
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import statistics
+import sys
+import time
+
+from cdcl import cdcl
+from local_search import gsat, variable_neighborhood_descent, walksat
+from portfolio import load_three_sat, satisfies
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; peak memory is then not recorded
+    resource = None
+
+# Workers start from a fresh interpreter: a forked one would inherit the parent's
+# resident memory, which then shows up in its peak
+CONTEXT = multiprocessing.get_context("spawn")
+
+SOLVERS = ["hill_climbing", "beam_search", "vnd", "gsat", "walksat", "cdcl"]
+RATIOS = [3.0, 3.5, 4.0, 4.26, 4.5, 5.0, 5.5]
+SIZES = [20, 50, 100]
+SEEDS = range(5)
+BEAM_WIDTH = 10
+
+def make_instance(n, ratio, seed):
+    """The same problem for the same (n, ratio, seed) on every run of the suite."""
+    random.seed(f"{n}-{ratio}-{seed}")
+    return load_three_sat().generate_3sat_problem(n, round(ratio * n))
+
+def run_solver(name, clauses, n, seed):
+    """Returns (solution, steps); steps are flips, conflicts, scored moves or clause-set evaluations."""
+    if name == "gsat":
+        return gsat(clauses, n, seed=seed)
+    if name == "walksat":
+        return walksat(clauses, n, seed=seed)
+    if name == "cdcl":
+        return cdcl(clauses, n, seed=seed)
+    if name == "vnd":
+        # What variable_neighborhood_descent in 3-SAT.py runs
+        return variable_neighborhood_descent(clauses, n, max_k=3, seed=seed)
+
+    three_sat = load_three_sat()
+    random.seed(seed)
+    # Count evaluations through the module globals the solvers look up on every call;
+    # this runs in a worker process, so the patched module is thrown away afterwards
+    evaluations = 0
+    count_satisfied_clauses = three_sat.count_satisfied_clauses
+    evaluate_solution = three_sat.evaluate_solution
+
+    def counting_count(solution, clauses):
+        nonlocal evaluations
+        evaluations += 1
+        return count_satisfied_clauses(solution, clauses)
+
+    def counting_evaluate(solution, clauses):
+        nonlocal evaluations
+        evaluations += 1
+        return evaluate_solution(solution, clauses)
+
+    three_sat.count_satisfied_clauses = counting_count
+    three_sat.evaluate_solution = counting_evaluate
+    if name == "hill_climbing":
+        solution = three_sat.hill_climbing(clauses, n)
+    elif name == "beam_search":
+        # Scored in NumPy without calling count_satisfied_clauses, so no step count
+        return three_sat.beam_search(clauses, n, BEAM_WIDTH), None
+    else:
+        raise ValueError(f"unknown solver {name}")
+    return solution, evaluations
+
+def measure(name, clauses, n, seed, connection):
+    """Worker process: solve once and send back (answered, seconds, steps, peak MB).
+
+    Peak memory is how far the solver raises the process's peak RSS above what it
+    was before solving (interpreter, imports and the instance).
+    """
+    load_three_sat()  # Imported before the baseline, like the solvers in this module
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    start_time = time.perf_counter()
+    solution, steps = run_solver(name, clauses, n, seed)
+    elapsed = time.perf_counter() - start_time
+    # CDCL returning None is a proof of unsatisfiability, which also counts as an answer
+    answered = satisfies(solution, clauses) if solution is not None else name == "cdcl"
+    peak = (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024 if resource else None
+    connection.send((answered, elapsed, steps, peak))
+    connection.close()
+
+def run_once(name, clauses, n, seed, timeout):
+    """Run one solver in a child process, killed after timeout seconds."""
+    receiver, sender = CONTEXT.Pipe(duplex=False)
+    process = CONTEXT.Process(target=measure, args=(name, clauses, n, seed, sender), daemon=True)
+    process.start()
+    sender.close()
+    if receiver.poll(timeout):
+        try:
+            result = receiver.recv()
+        except EOFError:  # The worker crashed
+            result = (False, timeout, None, None)
+    else:
+        result = (False, timeout, None, None)
+    process.terminate()
+    process.join()
+    return result
+
+def run_suite(solvers=SOLVERS, sizes=SIZES, ratios=RATIOS, seeds=SEEDS, timeout=10.0, log=sys.stderr):
+    """Run every solver on every (n, ratio, seed) instance.
+
+    Median time counts unanswered runs as taking the full timeout, so it cannot
+    improve just by giving up earlier. Rates are steps per second over the
+    runs that finished, answered or not.
+    """
+    results = []
+    for n in sizes:
+        for ratio in ratios:
+            instances = [make_instance(n, ratio, seed) for seed in seeds]
+            for name in solvers:
+                times, rates, peaks = [], [], []
+                answered = 0
+                for seed, clauses in zip(seeds, instances):
+                    success, elapsed, steps, peak = run_once(name, clauses, n, seed, timeout)
+                    answered += success
+                    times.append(elapsed if success else timeout)
+                    if steps is not None and elapsed > 0:
+                        rates.append(steps / elapsed)
+                    if peak is not None:
+                        peaks.append(peak)
+                result = {
+                    "solver": name,
+                    "n": n,
+                    "ratio": ratio,
+                    "runs": len(times),
+                    "success_rate": answered / len(times),
+                    "median_time": statistics.median(times),
+                    "steps_per_second": statistics.median(rates) if rates else None,
+                    "peak_memory_mb": max(peaks) if peaks else None,
+                }
+                results.append(result)
+                print(f"{name:>13} n={n:<4} ratio={ratio:<5} solved {answered}/{len(times)}  "
+                      f"median {result['median_time']:.3f} s", file=log, flush=True)
+    return results
+
+def compare(baseline, candidate, threshold=0.2, min_time=0.01):
+    """Regressions of candidate against baseline, as readable lines.
+
+    A result regresses when its median time grows by more than threshold (relative,
+    ignoring differences below min_time seconds) or its success rate drops by more
+    than threshold (absolute).
+    """
+    previous = {(result["solver"], result["n"], result["ratio"]): result for result in baseline["results"]}
+    regressions = []
+    for result in candidate["results"]:
+        old = previous.get((result["solver"], result["n"], result["ratio"]))
+        if old is None:
+            continue
+        label = f"{result['solver']} n={result['n']} ratio={result['ratio']}"
+        slower = result["median_time"] - old["median_time"]
+        if slower > min_time and slower > threshold * old["median_time"]:
+            regressions.append(f"{label}: median time {old['median_time']:.3f} s -> {result['median_time']:.3f} s")
+        if old["success_rate"] - result["success_rate"] > threshold:
+            regressions.append(f"{label}: success rate {old['success_rate']:.2f} -> {result['success_rate']:.2f}")
+    return regressions
+
+def parse_list(convert):
+    return lambda text: [convert(item) for item in text.split(",")]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the 3-SAT solvers across the phase transition.")
+    parser.add_argument("--output", default="sat_benchmark.json", help="where to write the JSON results")
+    parser.add_argument("--solvers", type=parse_list(str), default=SOLVERS)
+    parser.add_argument("--sizes", type=parse_list(int), default=SIZES, help="comma-separated values of n")
+    parser.add_argument("--ratios", type=parse_list(float), default=RATIOS, help="comma-separated clause/variable ratios")
+    parser.add_argument("--seeds", type=int, default=len(SEEDS), help="instances per (n, ratio)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--baseline", help="earlier JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slow-down (relative) or success drop")
+    args = parser.parse_args()
+
+    unknown = set(args.solvers) - set(SOLVERS)
+    if unknown:
+        parser.error(f"unknown solvers: {', '.join(sorted(unknown))}")
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timeout": args.timeout,
+        "seeds": args.seeds,
+        "results": run_suite(args.solvers, args.sizes, args.ratios, range(args.seeds), args.timeout),
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        for regression in regressions:
+            print("Regression:", regression)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against", args.baseline)
@@ -0,0 +1,79 @@
+import numpy as np
+
+def clauses_to_array(clauses):
+    """Clauses as an (m, k) int array of literals, shorter clauses padded with 0."""
+    clauses = [list(clause) for clause in clauses]
+    width = max((len(clause) for clause in clauses), default=0)
+    literals = np.zeros((len(clauses), width), dtype=np.int64)
+    for index, clause in enumerate(clauses):
+        literals[index, :len(clause)] = clause
+    return literals
+
+def literal_truth(beam, literals):
+    """(B, m, k) truth of every literal under every assignment in the beam; padding is False."""
+    variables = np.abs(literals) - 1
+    values = beam[:, np.maximum(variables, 0)]
+    return np.where(literals > 0, values, ~values) & (literals != 0)
+
+def count_satisfied(beam, literals):
+    """Vectorized count_satisfied_clauses for every row of a (B, n) boolean beam."""
+    return literal_truth(beam, literals).any(axis=2).sum(axis=1)
+
+def neighbor_scores(beam, literals):
+    """Satisfied-clause count of every single-flip neighbor, as a (B, n) array.
+
+    Entry [b, i] is what count_satisfied_clauses would return for beam[b] with
+    variable i + 1 flipped.
+    """
+    beam_size, n = beam.shape
+    variables = np.abs(literals) - 1
+    truth = literal_truth(beam, literals)
+    true_count = truth.sum(axis=2)
+    satisfied = true_count > 0
+    valid = literals != 0
+
+    delta = np.zeros(beam_size * n, dtype=np.int64)
+    offsets = (np.arange(beam_size) * n)[:, None]
+    width = literals.shape[1]
+    for slot in range(width):
+        # Handle each variable once per clause, at its first slot, counting all its
+        # literals there (a clause may hold both x and -x)
+        first = valid[:, slot].copy()
+        for earlier in range(slot):
+            first &= variables[:, earlier] != variables[:, slot]
+        if not first.any():
+            continue
+        same = [(variables[:, other] == variables[:, slot]) & valid[:, other] for other in range(width)]
+        true_here = sum(truth[:, :, other] & same[other] for other in range(width))
+        total_here = sum(same)
+        flipped_count = true_count - true_here + (total_here - true_here)
+        change = (flipped_count > 0).astype(np.int64) - satisfied
+        index = offsets + variables[:, slot]
+        delta += np.bincount(index[:, first].ravel(), weights=change[:, first].ravel(),
+                             minlength=beam_size * n).astype(np.int64)
+    return satisfied.sum(axis=1)[:, None] + delta.reshape(beam_size, n)
+
+def vectorized_beam_search(clauses, n, beam_width, max_iterations=1000, seed=None):
+    """Beam search from 3-SAT.py with the whole beam scored in one vectorized pass.
+
+    Each step keeps the beam_width best single-flip neighbors of the current beam,
+    chosen with argpartition instead of a full sort. Returns a list of booleans, or
+    None if nothing satisfies the formula within max_iterations steps.
+    """
+    rng = np.random.default_rng(seed)
+    literals = clauses_to_array(clauses)
+    m = len(literals)
+    beam = rng.random((beam_width, n)) < 0.5
+
+    for _ in range(max_iterations):
+        solved = np.flatnonzero(count_satisfied(beam, literals) == m)
+        if len(solved):
+            return beam[solved[0]].tolist()
+
+        scores = neighbor_scores(beam, literals).ravel()
+        keep = min(beam_width, len(scores))
+        best = np.argpartition(-scores, keep - 1)[:keep]
+        rows, flips = np.divmod(best, n)
+        beam = beam[rows]
+        beam[np.arange(keep), flips] ^= True
+    return None